@@ -15,7 +15,7 @@ from ..api import CopidockAPI, resolve_api
 from ...config.config import find_repo_root, load_state, save_state, DEFAULT_PROFILE
 from ...interactive.detection import auto_detect_context
 from ...interactive.flow import run_interactive_flow
-from ...interactive.domains import list_available_domains, display_domain_info, get_domain_display_name
+from ...interactive.domains import list_domain_display_names, display_domain_info, get_domain_display_name
 from ..synthesis.initial import generate_initial_stage_snapshot
 from ..gather import render_files_markdown
 
@@ -159,12 +159,12 @@ def prd_create(
     
     # Show available domains if none specified and interactive
     if not domain and interactive:
-        domains = list_available_domains()
+        display_names = list_domain_display_names()
+        domains = list(display_names)
         if domains:
             rprint("\n[bold cyan]📚 Available Domain Templates:[/bold cyan]")
             for i, d in enumerate(domains, 1):
-                display_name = get_domain_display_name(d)
-                rprint(f"  {i}. {d} - {display_name}")
+                rprint(f"  {i}. {d} - {display_names[d]}")
             rprint("  0. None (generic PRD)")
             
             choice = typer.prompt("\nSelect domain (0 for none)", default="0")
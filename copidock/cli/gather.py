@@ -74,8 +74,8 @@ def list_changed_files(repo_root: str) -> List[str]:
     if untracked:
         changed_files.extend(untracked.strip().split('\n'))
     
-    # Remove duplicates and empty strings
-    unique_files = list(set(f for f in changed_files if f.strip()))
+    # Remove duplicates and empty strings, keeping first-seen order
+    unique_files = list(dict.fromkeys(f for f in changed_files if f.strip()))
     
     return unique_files
 
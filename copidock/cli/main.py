@@ -173,8 +173,8 @@ def thread_cmd(
             repo_root = find_repo_root()
             context = auto_detect_context(repo_root)
             
-            repo = repo or context.get('repo', 'unknown')
-            branch = branch or context.get('branch', 'main')
+            repo = repo or context.repo
+            branch = branch or context.branch
             
             rprint(f"[dim]Auto-detected: {repo} (branch: {branch})[/dim]")
         thread_start(goal, repo, branch, profile, api, json_out)
@@ -333,7 +333,7 @@ def snapshot_cmd(
     
     # Check if PRD exists
     has_prd = state.get('active_prd') is not None
-    has_git_history = len(context.get('modified_files', [])) > 0 or context.get('commit_count', 0) > 0
+    has_git_history = len(context.modified_files) > 0 or context.commit_count > 0
     
     # Auto-detect stage
     if not has_prd and not has_git_history:
@@ -342,7 +342,7 @@ def snapshot_cmd(
         rprint("[yellow]   Consider creating a PRD first: copidock prd create --domain <name>[/yellow]")
         rprint("[yellow]   Or continue with snapshot (will use development mode)[/yellow]\n")
         detected_stage = "development"
-    elif any('README' in f.upper() for f in context.get('modified_files', [])):
+    elif any('README' in f.upper() for f in context.modified_files):
         detected_stage = "initial"
         rprint(f"[dim]Auto-detected stage: {detected_stage} (README found in changes)[/dim]")
     else:
@@ -394,8 +394,8 @@ def snapshot_cmd(
             thread_data = {
             'thread_id': thread_id,
             'goal'   : state.get('goal', 'development task'),
-            'repo'   : state.get('repo') or ctx_for_meta.get('repo', ''),
-            'branch' : state.get('branch') or ctx_for_meta.get('branch', 'main'),
+            'repo'   : state.get('repo') or ctx_for_meta.repo,
+            'branch' : state.get('branch') or ctx_for_meta.branch,
         }
             
             # Comprehensive gathering
@@ -525,8 +525,8 @@ def snapshot_cmd(
         thread_data = {
             'thread_id': thread_id,
             'goal'   : state.get('goal', 'development task'),
-            'repo'   : state.get('repo') or ctx_for_meta.get('repo', ''),
-            'branch' : state.get('branch') or ctx_for_meta.get('branch', 'main'),
+            'repo'   : state.get('repo') or ctx_for_meta.repo,
+            'branch' : state.get('branch') or ctx_for_meta.branch,
         }
         
         enhanced_context = {
@@ -3,11 +3,21 @@ Synthesis module for generating comprehensive snapshots.
 Split by development stage for better organization.
 """
 
-from .base import categorize_files, derive_template_vars
+from .base import DEBUG, categorize_files, derive_template_vars
 from .initial import generate_initial_stage_snapshot
 from .development import generate_development_stage_snapshot
 from .analysis import analyze_commit_patterns, mine_open_questions
 
+def _initial_stage_handler(thread_data, file_paths, recent_commits, repo_root, persona, enhanced_context):
+    """Adapt the initial stage to the common handler signature (no git inputs)"""
+    return generate_initial_stage_snapshot(thread_data, enhanced_context, persona)
+
+# Stage -> handler; unknown stages use development logic
+_STAGE_DISPATCH = {
+    'initial': _initial_stage_handler,
+    'development': generate_development_stage_snapshot
+}
+
 def generate_comprehensive_snapshot(thread_data, file_paths, recent_commits, repo_root, persona, enhanced_context):
     """Main entry point for comprehensive snapshot generation"""
     from rich import print as rprint
@@ -20,18 +30,15 @@ def generate_comprehensive_snapshot(thread_data, file_paths, recent_commits, rep
     stage = enhanced_context.get('stage', 'development')
     
     # DEBUGGING: Print what stage we detected
-    rprint(f"[dim]🔍 Detected stage: {stage}[/dim]")
-    rprint(f"[dim]🔍 Input persona: {persona}[/dim]")
+    if DEBUG:
+        rprint(f"[dim]🔍 Detected stage: {stage}[/dim]")
+        rprint(f"[dim]🔍 Input persona: {persona}[/dim]")
     
     # Route to appropriate stage handler
-    if stage == "initial":
-        rprint(f"[dim]→ Using initial stage logic[/dim]")
-        from .initial import generate_initial_stage_snapshot
-        return generate_initial_stage_snapshot(thread_data, enhanced_context, persona)
-    else:
-        rprint(f"[dim]→ Using development stage logic[/dim]")
-        from .development import generate_development_stage_snapshot
-        return generate_development_stage_snapshot(thread_data, file_paths, recent_commits, repo_root, persona, enhanced_context)
+    route = stage if stage in _STAGE_DISPATCH else 'development'
+    if DEBUG:
+        rprint(f"[dim]→ Using {route} stage logic[/dim]")
+    return _STAGE_DISPATCH[route](thread_data, file_paths, recent_commits, repo_root, persona, enhanced_context)
 
 __all__ = [
     'generate_comprehensive_snapshot',
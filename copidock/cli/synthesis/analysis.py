@@ -1,15 +1,227 @@
 """
 Git analysis and pattern detection utilities
 """
+import copy
+import io
 import re
+from collections import Counter
+from functools import lru_cache
 from typing import List, Dict, Any
 from pathlib import Path
+from .base import compile_keyword_scanner
+
+# Work-area fallback and change-impact levels returned by the analyzers
+WORK_AREA_GENERAL = 'general'
+IMPACT_HIGH = 'high'
+IMPACT_MEDIUM = 'medium'
+IMPACT_LOW = 'low'
+
+# File type -> path keywords, checked in order (first match wins)
+_FILE_TYPE_KEYWORDS = {
+    'api': ('api/', 'endpoints/', 'routes/', 'controllers/'),
+    'frontend': ('frontend/', 'ui/', 'components/', 'views/', '.vue', '.jsx', '.tsx'),
+    'database': ('migration', 'schema', 'models/', 'database/'),
+    'tests': ('test', 'spec', '__tests__'),
+    'config': ('config', 'settings', '.env', 'docker', 'deploy'),
+    'docs': ('readme', 'docs/', '.md', 'documentation')
+}
+
+_FILE_TYPES = tuple(_FILE_TYPE_KEYWORDS) + ('other',)
+
+_scan_file_types = compile_keyword_scanner(_FILE_TYPE_KEYWORDS)
+
+# Commit intent -> keywords; dict order breaks ties between intents
+_INTENT_PATTERNS = {
+    'feature': frozenset(('add', 'implement', 'create', 'new')),
+    'bugfix': frozenset(('fix', 'bug', 'issue', 'resolve', 'correct')),
+    'refactor': frozenset(('refactor', 'clean', 'improve', 'optimize')),
+    'docs': frozenset(('docs', 'documentation', 'readme', 'comment')),
+    'test': frozenset(('test', 'testing', 'spec', 'coverage')),
+    'config': frozenset(('config', 'setup', 'deploy', 'ci', 'build'))
+}
+
+_URGENT_KEYWORDS = frozenset(('urgent', 'critical', 'hotfix', 'emergency', 'asap'))
+
+# Commit-subject tokenizer and the words it ignores
+_WORD_RE = re.compile(r'\b\w{3,}\b')
+
+_STOPWORDS = frozenset(('the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were'))
+
+# Every intent/urgency keyword maps to itself, so a scan returns the set of
+# keywords present
+_scan_intent_keywords = compile_keyword_scanner(
+    {keyword: (keyword,) for keyword in _URGENT_KEYWORDS.union(*_INTENT_PATTERNS.values())},
+    ignore_case=True
+)
+
+# Open-question markers, fused into one pattern with context capture
+_OPEN_QUESTION_TYPES = ('TODO', 'FIXME', 'QUESTION', 'TBD', 'HACK', 'XXX', 'NOTE', 'REVIEW')
+
+_OPEN_QUESTION_TOKENS = _OPEN_QUESTION_TYPES + ('??',)
+
+# Word tags must stand alone (no 'denote' -> NOTE, no 'TODOs'); the capture
+# is a single bounded quantifier, so there is nothing to backtrack into
+_OPEN_QUESTION_RE = re.compile(
+    r'(?P<tag>(?<![a-z0-9])(?:'
+    + '|'.join(f'{ptype}|@{ptype.lower()}' for ptype in _OPEN_QUESTION_TYPES)
+    + r')\b|\?{2,})'
+    r':?\s*(?P<text>.{3,100})',
+    re.IGNORECASE
+)
+
+# Block-comment closers left at the end of a captured marker
+_COMMENT_CLOSER_RE = re.compile(r'\s*(?:\*/|-->)\s*$')
+
+# Bare (uppercase) marker tokens, used to jump straight to candidate lines
+# in an uppercased file buffer
+_OPEN_QUESTION_TOKEN_RE = re.compile('|'.join(map(re.escape, _OPEN_QUESTION_TOKENS)))
+
+def _iter_open_question_markers(text):
+    """Yield (marker type, captured text), matching one findall per marker type"""
+    # Most lines carry no marker; a plain substring check rejects them
+    # before the regex engine runs
+    upper_text = text.upper()
+    if not any(token in upper_text for token in _OPEN_QUESTION_TOKENS):
+        return
+    
+    last_end = {}
+    pos = 0
+    while True:
+        match = _OPEN_QUESTION_RE.search(text, pos)
+        if match is None:
+            return
+        tag = match.group('tag').lower().lstrip('@')
+        ptype = tag.upper() if tag[0] != '?' else 'QUESTION'
+        # Same-type matches never overlap, as with a per-type findall
+        if match.start() >= last_end.get(ptype, 0):
+            last_end[ptype] = match.end()
+            yield ptype, _COMMENT_CLOSER_RE.sub('', match.group('text'))
+        # Resume right after this match's start so markers nested in its
+        # captured text are still found
+        pos = match.start() + 1
+
+def _iter_marker_lines(content):
+    """Yield (line number, line) for each line of content holding a marker token"""
+    # One search over the uppercased buffer jumps from token to token instead
+    # of visiting every line
+    upper_content = content.upper()
+    if len(upper_content) != len(content):
+        # Length-changing case mappings shift offsets; check line by line
+        for line_num, line in enumerate(content.split('\n'), 1):
+            upper_line = line.upper()
+            if any(token in upper_line for token in _OPEN_QUESTION_TOKENS):
+                yield line_num, line
+        return
+    
+    line_num = 1
+    counted_to = 0
+    pos = 0
+    while True:
+        token = _OPEN_QUESTION_TOKEN_RE.search(upper_content, pos)
+        if token is None:
+            return
+        line_start = content.rfind('\n', 0, token.start()) + 1
+        line_end = content.find('\n', token.start())
+        if line_end == -1:
+            line_end = len(content)
+        line_num += content.count('\n', counted_to, line_start)
+        counted_to = line_start
+        pos = line_end + 1
+        yield line_num, content[line_start:line_end]
+
+# Paths of minified, bundled, lock and vendored files skipped by mining
+_GENERATED_PATH_RE = re.compile(
+    r'\.(?:min\.js|min\.css|bundle\.js|lock)$|(?:^|/)(?:dist|build|node_modules|vendor)/'
+)
+
+# Static recommendation and risk sets keyed by work area / commit intent
+_RECOMMENDATIONS_BY_AREA = {
+    'api': (
+        "Test all modified API endpoints thoroughly",
+        "Verify authentication and authorization still work",
+        "Update API documentation (OpenAPI/Swagger)",
+        "Check for breaking changes in API contracts"
+    ),
+    'frontend': (
+        "Test across different browsers and screen sizes", 
+        "Check mobile responsiveness",
+        "Verify accessibility compliance",
+        "Test user interactions and workflows"
+    ),
+    'database': (
+        "Create reversible database migrations",
+        "Test migrations on staging data first",
+        "Backup production data before deployment",
+        "Monitor query performance impact"
+    ),
+    'tests': (
+        "Run full test suite to ensure no regressions",
+        "Check test coverage metrics",
+        "Verify tests are not flaky or interdependent",
+        "Update test documentation if needed"
+    )
+}
+
+_RECOMMENDATIONS_BY_INTENT = {
+    'feature': (
+        "Document the new feature functionality",
+        "Add comprehensive tests for the new feature",
+        "Consider feature flags for gradual rollout"
+    ),
+    'bugfix': (
+        "Add regression tests to prevent future occurrences",
+        "Verify the fix doesn't introduce new issues",
+        "Document the root cause and solution"
+    )
+}
+
+_RISKS_BY_AREA = {
+    'api': (
+        "Breaking API contracts for existing clients",
+        "Authentication or authorization bypass",
+        "Performance impact on high-traffic endpoints"
+    ),
+    'database': (
+        "Data loss during migration",
+        "Performance degradation of existing queries",
+        "Constraint violations with existing data"
+    ),
+    'frontend': (
+        "Cross-browser compatibility issues",
+        "Mobile device performance problems",
+        "Accessibility regressions"
+    )
+}
+
+# Commit fields read by the analyzers; they make up the cache key
+_COMMIT_KEY_FIELDS = ('hash', 'subject', 'message')
 
 def analyze_development_context(file_paths, recent_commits, repo_root):
     """Analyze what type of development work is happening"""
+    # Stages re-querying the same change set within one run reuse the
+    # earlier analysis; callers get their own top-level dict, but the nested
+    # analyses are shared and must be treated as read-only
+    try:
+        commits_key = tuple(
+            tuple((field, commit[field]) for field in _COMMIT_KEY_FIELDS if field in commit)
+            for commit in recent_commits
+        )
+        return copy.copy(_analyze_development_context_cached(tuple(file_paths), commits_key))
+    except TypeError:
+        # Unhashable or malformed input; analyze without caching
+        return _analyze_development_context(file_paths, recent_commits)
+
+@lru_cache(maxsize=8)
+def _analyze_development_context_cached(file_paths, commits_key):
+    return _analyze_development_context(file_paths, [dict(items) for items in commits_key])
+
+def _analyze_development_context(file_paths, recent_commits):
+    # Normalize paths once; analyzers match against the lowered form and
+    # keep the original paths for display
+    lowered_paths = list(map(str.lower, file_paths))
     
     # Analyze file types and patterns
-    file_analysis = analyze_file_patterns(file_paths)
+    file_analysis = analyze_file_patterns(file_paths, lowered_paths)
     
     # Analyze commit messages for intent
     commit_analysis = analyze_commit_patterns(recent_commits)
@@ -32,49 +244,38 @@ def analyze_development_context(file_paths, recent_commits, repo_root):
         'risk_areas': identify_risk_areas(work_area, file_analysis)
     }
 
-def analyze_file_patterns(file_paths):
+def analyze_file_patterns(file_paths, lowered_paths=None):
     """Analyze the types of files being modified"""
-    patterns = {
-        'api': 0,
-        'frontend': 0,
-        'database': 0,
-        'tests': 0,
-        'config': 0,
-        'docs': 0,
-        'other': 0
-    }
+    if lowered_paths is None:
+        lowered_paths = list(map(str.lower, file_paths))
     
-    file_details = []
-    
-    for file_path in file_paths:
-        path_lower = file_path.lower()
-        file_type = 'other'
-        
-        if any(keyword in path_lower for keyword in ['api/', 'endpoints/', 'routes/', 'controllers/']):
-            file_type = 'api'
-        elif any(keyword in path_lower for keyword in ['frontend/', 'ui/', 'components/', 'views/', '.vue', '.jsx', '.tsx']):
-            file_type = 'frontend'  
-        elif any(keyword in path_lower for keyword in ['migration', 'schema', 'models/', 'database/']):
-            file_type = 'database'
-        elif any(keyword in path_lower for keyword in ['test', 'spec', '__tests__']):
-            file_type = 'tests'
-        elif any(keyword in path_lower for keyword in ['config', 'settings', '.env', 'docker', 'deploy']):
-            file_type = 'config'
-        elif any(keyword in path_lower for keyword in ['readme', 'docs/', '.md', 'documentation']):
-            file_type = 'docs'
-        
-        patterns[file_type] += 1
-        file_details.append({
-            'path': file_path,
-            'type': file_type
-        })
+    # Parallel path/type lists instead of one dict per file; classification
+    # is mapped over the whole batch and tallied by Counter in C
+    paths = list(file_paths)
+    types = list(map(_classify_file_type, lowered_paths))
+    
+    patterns = Counter(dict.fromkeys(_FILE_TYPES, 0))
+    patterns.update(types)
+    
+    # Breakdown-ready (area, count) pairs, busiest area first
+    nonzero_categories = sorted(
+        ((area, count) for area, count in patterns.items() if count > 0 and area != 'other'),
+        key=lambda item: -item[1]
+    )
     
     return {
-        'patterns': patterns,
-        'details': file_details,
-        'total_files': len(file_paths)
+        'patterns': dict(patterns),
+        'nonzero_categories': nonzero_categories,
+        'paths': paths,
+        'types': types,
+        'total_files': len(paths)
     }
 
+def _classify_file_type(path_lower):
+    """First file type (in table order) with a keyword in the lowered path"""
+    hits = _scan_file_types(path_lower)
+    return next((t for t in _FILE_TYPE_KEYWORDS if t in hits), 'other')
+
 def analyze_commit_patterns(recent_commits: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Enhanced commit analysis with error handling"""
     if not recent_commits:
@@ -100,13 +301,11 @@ def analyze_commit_patterns(recent_commits: List[Dict[str, Any]]) -> Dict[str, A
         'test_commits': 0,
         'docs_commits': 0,
         'config_commits': 0,
-        'common_words': {},
+        'common_words': Counter(),
         'urgency_indicators': []
     }
     
     urgency_words = ['urgent', 'critical', 'hotfix', 'emergency', 'asap', 'breaking']
-    commit_messages = [commit.get('message', '').lower() for commit in recent_commits]
-    combined_text = ' '.join(commit_messages)
     
     for commit in recent_commits:
         try:
@@ -137,40 +336,40 @@ def analyze_commit_patterns(recent_commits: List[Dict[str, Any]]) -> Dict[str, A
                         'subject': commit.get('subject', 'No subject')
                     })
             
-            # Enhanced word counting with better filtering
-            stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were'}
-            words = re.findall(r'\b\w{3,}\b', subject.lower())
-            for word in words:
-                if word not in stopwords and len(word) > 2:
-                    patterns['common_words'][word] = patterns['common_words'].get(word, 0) + 1
+            # Enhanced word counting with better filtering (subject is already
+            # lowercased and the tokenizer only yields 3+ character words)
+            patterns['common_words'].update(
+                word for word in _WORD_RE.findall(subject) if word not in _STOPWORDS
+            )
                     
         except Exception as e:
             # Log error but continue processing other commits
             continue
     
-    # Detect intent patterns
-    intent_patterns = {
-        'feature': ['add', 'implement', 'create', 'new'],
-        'bugfix': ['fix', 'bug', 'issue', 'resolve', 'correct'],
-        'refactor': ['refactor', 'clean', 'improve', 'optimize'],
-        'docs': ['docs', 'documentation', 'readme', 'comment'],
-        'test': ['test', 'testing', 'spec', 'coverage'],
-        'config': ['config', 'setup', 'deploy', 'ci', 'build']
-    }
+    # Scan each message in place rather than joining them into one string;
+    # keywords contain no spaces, so no match could span two messages anyway
+    found_keywords = set()
+    for commit in recent_commits:
+        message = commit.get('message', '')
+        # The scanner ignores ASCII case itself; only non-ASCII text needs
+        # full Unicode lowercasing first
+        if not message.isascii():
+            message = message.lower()
+        found_keywords |= _scan_intent_keywords(message)
     
+    # Detect intent patterns
     detected_intent = 'general'
     max_matches = 0
     
-    for intent, keywords in intent_patterns.items():
-        matches = sum(1 for keyword in keywords if keyword in combined_text)
+    for intent, keywords in _INTENT_PATTERNS.items():
+        matches = len(keywords & found_keywords)
         if matches > max_matches:
             max_matches = matches
             detected_intent = intent
     
     # Detect urgency
     urgency = 'normal'
-    urgent_keywords = ['urgent', 'critical', 'hotfix', 'emergency', 'asap']
-    if any(keyword in combined_text for keyword in urgent_keywords):
+    if not _URGENT_KEYWORDS.isdisjoint(found_keywords):
         urgency = 'high'
     
     # Add intent analysis to patterns
@@ -185,108 +384,53 @@ def analyze_commit_patterns(recent_commits: List[Dict[str, Any]]) -> Dict[str, A
 
 def determine_work_area(file_analysis):
     """Determine the primary area of development work"""
-    patterns = file_analysis['patterns']
-    
-    # Find the area with the most file changes
-    max_files = max(patterns.values())
-    if max_files == 0:
-        return 'general'
-    
-    for area, count in patterns.items():
-        if count == max_files and area != 'other':
-            return area
-    
-    return 'general'
+    # Keep dict order in the key: it decides ties
+    return _determine_work_area_cached(tuple(file_analysis['patterns'].items()))
+
+@lru_cache(maxsize=128)
+def _determine_work_area_cached(pattern_items):
+    # 'other' is not a work area, so it never competes for the max
+    patterns = {area: count for area, count in pattern_items if area != 'other'}
+    
+    # Find the area with the most file changes (first key wins on ties)
+    if not patterns:
+        return WORK_AREA_GENERAL
+
+    area = max(patterns, key=patterns.get)
+    if patterns[area] == 0:
+        return WORK_AREA_GENERAL
+
+    return area
 
 def assess_change_impact(file_analysis, commit_analysis):
     """Assess the potential impact of changes"""
-    file_count = file_analysis['total_files']
-    commit_count = commit_analysis['commit_count']
-    urgency = commit_analysis['urgency']
-    
+    return _assess_change_impact_cached(
+        file_analysis['total_files'],
+        commit_analysis['commit_count'],
+        commit_analysis['urgency']
+    )
+
+@lru_cache(maxsize=128)
+def _assess_change_impact_cached(file_count, commit_count, urgency):
     if urgency == 'high' or file_count > 10 or commit_count > 5:
-        return 'high'
+        return IMPACT_HIGH
     elif file_count > 5 or commit_count > 3:
-        return 'medium'
+        return IMPACT_MEDIUM
     else:
-        return 'low'
+        return IMPACT_LOW
 
 def generate_development_recommendations(work_area, file_analysis, commit_analysis):
     """Generate specific recommendations based on the development context"""
-    recommendations = []
-    
-    intent = commit_analysis['intent']
-    
-    if work_area == 'api':
-        recommendations.extend([
-            "Test all modified API endpoints thoroughly",
-            "Verify authentication and authorization still work",
-            "Update API documentation (OpenAPI/Swagger)",
-            "Check for breaking changes in API contracts"
-        ])
-    
-    elif work_area == 'frontend':
-        recommendations.extend([
-            "Test across different browsers and screen sizes", 
-            "Check mobile responsiveness",
-            "Verify accessibility compliance",
-            "Test user interactions and workflows"
-        ])
-    
-    elif work_area == 'database':
-        recommendations.extend([
-            "Create reversible database migrations",
-            "Test migrations on staging data first",
-            "Backup production data before deployment",
-            "Monitor query performance impact"
-        ])
-    
-    elif work_area == 'tests':
-        recommendations.extend([
-            "Run full test suite to ensure no regressions",
-            "Check test coverage metrics",
-            "Verify tests are not flaky or interdependent",
-            "Update test documentation if needed"
-        ])
+    recommendations = list(_RECOMMENDATIONS_BY_AREA.get(work_area, ()))
     
     # Add intent-specific recommendations
-    if intent == 'feature':
-        recommendations.extend([
-            "Document the new feature functionality",
-            "Add comprehensive tests for the new feature",
-            "Consider feature flags for gradual rollout"
-        ])
-    elif intent == 'bugfix':
-        recommendations.extend([
-            "Add regression tests to prevent future occurrences",
-            "Verify the fix doesn't introduce new issues",
-            "Document the root cause and solution"
-        ])
+    recommendations.extend(_RECOMMENDATIONS_BY_INTENT.get(commit_analysis['intent'], ()))
     
     return recommendations
 
 def identify_risk_areas(work_area, file_analysis):
     """Identify potential risk areas based on development context"""
-    risks = []
-    
-    if work_area == 'api':
-        risks.extend([
-            "Breaking API contracts for existing clients",
-            "Authentication or authorization bypass",
-            "Performance impact on high-traffic endpoints"
-        ])
-    elif work_area == 'database':
-        risks.extend([
-            "Data loss during migration",
-            "Performance degradation of existing queries",
-            "Constraint violations with existing data"
-        ])
-    elif work_area == 'frontend':
-        risks.extend([
-            "Cross-browser compatibility issues",
-            "Mobile device performance problems",
-            "Accessibility regressions"
-        ])
+    risks = list(_RISKS_BY_AREA.get(work_area, ()))
     
     # General risks based on file count
     if file_analysis['total_files'] > 5:
@@ -297,23 +441,25 @@ def identify_risk_areas(work_area, file_analysis):
 def mine_open_questions(file_paths: List[str], repo_root: str, recent_commits: List[Dict[str, Any]]) -> str:
     """Enhanced extraction of TODOs, FIXMEs, and questions from files and commits"""
     
-    # Enhanced patterns with context capture
-    patterns = {
-        'TODO': r'(?:TODO|@todo):?\s*(.{3,100})',
-        'FIXME': r'(?:FIXME|@fixme):?\s*(.{3,100})',
-        'QUESTION': r'(?:QUESTION|@question|\?{2,}):?\s*(.{3,100})',
-        'TBD': r'(?:TBD|@tbd):?\s*(.{3,100})',
-        'HACK': r'(?:HACK|@hack):?\s*(.{3,100})',
-        'XXX': r'(?:XXX|@xxx):?\s*(.{3,100})',
-        'NOTE': r'(?:NOTE|@note):?\s*(.{3,100})',
-        'REVIEW': r'(?:REVIEW|@review):?\s*(.{3,100})'
-    }
+    questions_by_type = {ptype: [] for ptype in _OPEN_QUESTION_TYPES}
     
-    questions_by_type = {ptype: [] for ptype in patterns.keys()}
+    total_limit = 12  # Global limit to prevent huge sections
+    # Stop reading files once there is a comfortable surplus over what the
+    # output can show; the buffer leaves room for priority/path ordering
+    scan_limit = total_limit * 3
+    collected = 0
+    scan_truncated = False
     
     # Enhanced file scanning with size limits and error handling
     for file_path in file_paths[:15]:  # Reasonable limit
+        if collected >= scan_limit:
+            scan_truncated = True
+            break
         try:
+            # Generated/vendored files carry no human markers
+            if _GENERATED_PATH_RE.search(file_path.replace('\\', '/').lower()):
+                continue
+                
             full_path = Path(repo_root) / file_path
             if not full_path.exists() or not full_path.is_file():
                 continue
@@ -323,62 +469,52 @@ def mine_open_questions(file_paths: List[str], repo_root: str, recent_commits: L
             if file_size > 2 * 1024 * 1024:  # Skip files > 2MB
                 continue
                 
-            # Safe file reading with encoding fallback
-            try:
-                content = full_path.read_text(encoding='utf-8')
-            except UnicodeDecodeError:
-                try:
-                    content = full_path.read_text(encoding='latin-1', errors='ignore')
-                except:
-                    continue  # Skip if can't read
-                    
-            lines = content.split('\n')
+            with full_path.open('rb') as raw:
+                # Sniff the head: NUL bytes mean binary, and a full block with
+                # almost no newlines is minified output
+                head = raw.read(8192)
+                if b'\x00' in head or (len(head) == 8192 and head.count(b'\n') < 4):
+                    continue
+                content = (head + raw.read()).decode('utf-8', errors='replace')
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
             
-            for line_num, line in enumerate(lines, 1):
+            for line_num, line in _iter_marker_lines(content):
+                if collected >= scan_limit:
+                    scan_truncated = True
+                    break
+                    
                 # Skip very long lines to avoid regex performance issues
                 if len(line) > 200:
                     line = line[:200] + "..."
                     
-                for pattern_type, pattern in patterns.items():
-                    try:
-                        matches = re.findall(pattern, line, re.IGNORECASE)
-                        for match in matches:
-                            clean_match = match.strip().rstrip('.,;:')
-                            if len(clean_match) > 5:  # Filter very short matches
-                                questions_by_type[pattern_type].append({
-                                    'text': clean_match,
-                                    'file': file_path,
-                                    'line': line_num,
-                                    'context': line.strip()[:80] + ('...' if len(line.strip()) > 80 else '')
-                                })
-                    except re.error:
-                        # Skip malformed regex patterns
-                        continue
-                        
+                for pattern_type, match in _iter_open_question_markers(line):
+                    clean_match = match.strip().rstrip('.,;:')
+                    if len(clean_match) > 5:  # Filter very short matches
+                        questions_by_type[pattern_type].append({
+                            'text': clean_match,
+                            'file': file_path,
+                            'line': line_num,
+                            'context': line.strip()[:80] + ('...' if len(line.strip()) > 80 else '')
+                        })
+                        collected += 1
+                    
         except Exception as e:
             # Log but continue with other files
             continue
     
     # Enhanced commit message analysis
     for commit in recent_commits:
-        try:
-            commit_text = f"{commit.get('subject', '')} {commit.get('body', '')}"
-            for pattern_type, pattern in patterns.items():
-                try:
-                    matches = re.findall(pattern, commit_text, re.IGNORECASE)
-                    for match in matches:
-                        clean_match = match.strip().rstrip('.,;:')
-                        if len(clean_match) > 5:
-                            questions_by_type[pattern_type].append({
-                                'text': clean_match,
-                                'file': f"Commit {commit.get('hash', 'unknown')[:8]}",
-                                'line': 0,
-                                'context': commit.get('subject', 'No subject')
-                            })
-                except re.error:
-                    continue
-        except Exception as e:
-            continue
+        commit_text = f"{commit.get('subject', '')} {commit.get('body', '')}"
+        for pattern_type, match in _iter_open_question_markers(commit_text):
+            clean_match = match.strip().rstrip('.,;:')
+            if len(clean_match) > 5:
+                questions_by_type[pattern_type].append({
+                    'text': clean_match,
+                    'file': f"Commit {commit.get('hash', 'unknown')[:8]}",
+                    'line': 0,
+                    'context': commit.get('subject', 'No subject')
+                })
     
     # Format output with better organization
     if not any(questions_by_type.values()):
@@ -390,7 +526,6 @@ def mine_open_questions(file_paths: List[str], repo_root: str, recent_commits: L
     priority_types = ['FIXME', 'TODO', 'QUESTION', 'REVIEW', 'HACK', 'TBD', 'XXX', 'NOTE']
     
     question_count = 0
-    total_limit = 12  # Global limit to prevent huge sections
     
     for qtype in priority_types:
         questions = questions_by_type[qtype]
@@ -415,6 +550,7 @@ def mine_open_questions(file_paths: List[str], repo_root: str, recent_commits: L
     # Add summary if we hit limits
     total_questions = sum(len(questions) for questions in questions_by_type.values())
     if total_questions > question_count:
-        output.append(f"*... and {total_questions - question_count} more questions found*")
+        more = "at least " if scan_truncated else ""
+        output.append(f"*... and {more}{total_questions - question_count} more questions found*")
     
     return "\n".join(output)
\ No newline at end of file
@@ -1,38 +1,93 @@
 """
 Common utilities shared across synthesis stages
 """
-from typing import List, Dict, Any, Optional
+import os
+import re
+from typing import List, Dict, Any, Optional, Sequence, Set, Callable
 from ...templates.loader import template_loader
 
-def categorize_files(file_paths: List[str]) -> Dict[str, List[str]]:
-    """Categorize files by type"""
-    categories = {
-        "Infrastructure": [],
-        "Backend/Lambda": [], 
-        "Frontend": [],
-        "Configuration": [],
-        "Tests": [],
-        "Documentation": [],
-        "Other": []
+# Template-loading and analysis diagnostics are printed only when
+# COPIDOCK_DEBUG=1; otherwise their messages are never even formatted
+DEBUG = os.environ.get('COPIDOCK_DEBUG') == '1'
+
+def compile_keyword_scanner(keywords_by_category: Dict[str, Sequence[str]],
+                            ignore_case: bool = False) -> Callable[[str], Set[str]]:
+    """
+    Compile {category: keywords} into a single-pass substring scanner.
+    
+    The returned function maps a string to the set of categories that have at
+    least one keyword occurring in it. Each regex search resumes one character
+    past the previous hit so overlapping keywords are still seen, and a hit
+    also counts for every keyword that is a prefix of the matched one.
+    """
+    category_of = {}
+    for category, keywords in keywords_by_category.items():
+        for keyword in keywords:
+            category_of.setdefault(keyword.lower() if ignore_case else keyword, set()).add(category)
+    # The alternation prefers the longest keyword at a position; credit the
+    # shorter keywords starting there too
+    categories_of_match = {
+        keyword: frozenset().union(*(cats for other, cats in category_of.items() if keyword.startswith(other)))
+        for keyword in category_of
     }
+    alternation = '|'.join(map(re.escape, sorted(category_of, key=len, reverse=True)))
+    # ASCII-only case folding: callers lowercase non-ASCII text themselves
+    search = re.compile(alternation, re.IGNORECASE | re.ASCII if ignore_case else 0).search
+    
+    def scan(text: str) -> Set[str]:
+        hits = set()
+        match = search(text)
+        while match is not None:
+            matched = match.group()
+            hits.update(categories_of_match[matched.lower() if ignore_case else matched])
+            match = search(text, match.start() + 1)
+        return hits
+    
+    return scan
+
+# Category -> path keywords and file extensions; categories are checked in
+# this order
+_CATEGORY_KEYWORDS = {
+    "Infrastructure": ('infra/',),
+    "Backend/Lambda": ('lambda/', 'lambdas/'),
+    "Frontend": (),
+    "Configuration": ('config', 'requirements.txt', 'package.json', 'setup.py'),
+    "Tests": ('test',),
+    "Documentation": ('readme',)
+}
+
+_EXTENSION_CATEGORIES = {
+    '.tf': "Infrastructure", '.yml': "Infrastructure", '.yaml': "Infrastructure",
+    '.py': "Backend/Lambda",
+    '.js': "Frontend", '.jsx': "Frontend", '.ts': "Frontend", '.tsx': "Frontend",
+    '.vue': "Frontend", '.react': "Frontend",
+    '.md': "Documentation", '.rst': "Documentation", '.txt': "Documentation"
+}
+
+_scan_categories = compile_keyword_scanner(_CATEGORY_KEYWORDS)
+
+def categorize_files(file_paths: List[str], lowered_paths: Optional[List[str]] = None) -> Dict[str, List[str]]:
+    """Categorize files by type (pass lowered_paths to reuse already-lowercased paths)"""
+    if lowered_paths is None:
+        lowered_paths = list(map(str.lower, file_paths))
     
-    for file_path in file_paths:
-        path_lower = file_path.lower()
+    categories = {category: [] for category in _CATEGORY_KEYWORDS}
+    categories["Other"] = []
+    
+    for file_path, path_lower in zip(file_paths, lowered_paths):
+        hits = _scan_categories(path_lower)
+        # Suffix after the basename's last dot; unlike splitext, a dot-named
+        # file such as '.tf' still has one
+        _, dot, suffix = path_lower.rpartition('/')[2].rpartition('.')
+        extension_category = dot and _EXTENSION_CATEGORIES.get(dot + suffix)
+        if extension_category:
+            hits.add(extension_category)
+        # Test files are never classified as backend code
+        if "Tests" in hits:
+            hits.discard("Backend/Lambda")
         
-        if any(x in path_lower for x in ['infra/', '.tf', '.yml', '.yaml']):
-            categories["Infrastructure"].append(file_path)
-        elif any(x in path_lower for x in ['lambda/', 'lambdas/', '.py']) and 'test' not in path_lower:
-            categories["Backend/Lambda"].append(file_path)
-        elif any(x in path_lower for x in ['.js', '.jsx', '.ts', '.tsx', '.vue', '.react']):
-            categories["Frontend"].append(file_path)
-        elif any(x in path_lower for x in ['config', 'requirements.txt', 'package.json', 'setup.py']):
-            categories["Configuration"].append(file_path)
-        elif 'test' in path_lower:
-            categories["Tests"].append(file_path)
-        elif any(x in path_lower for x in ['.md', '.rst', '.txt', 'readme']):
-            categories["Documentation"].append(file_path)
-        else:
-            categories["Other"].append(file_path)
+        category = next((c for c in _CATEGORY_KEYWORDS if c in hits), "Other")
+        categories[category].append(file_path)
     
     # Remove empty categories
     return {k: v for k, v in categories.items() if v}
@@ -42,6 +97,12 @@ def derive_template_vars(thread_data: Dict[str, Any], file_categories: Dict[str,
     """Derive template variables using persona templates"""
     return template_loader.resolve_template_vars(persona, thread_data, file_categories, enhanced_context)
 
+def format_bullets(items: List[Any]) -> str:
+    """Render items as a markdown bullet list with a single join"""
+    if not items:
+        return ""
+    return "- " + "\n- ".join(map(str, items))
+
 def get_category_impact(category: str, file_count: int) -> str:
     """Get impact indicator for file category"""
     if category == "Infrastructure" and file_count > 0:
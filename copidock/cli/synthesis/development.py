@@ -2,11 +2,54 @@
 Development stage synthesis - git-aware continuous development
 Combines YML templates with real-time git analysis
 """
+import copy
+from functools import lru_cache
 from typing import List, Dict, Any
 from rich import print as rprint
 from ...templates.loader import template_loader
 from .analysis import analyze_development_context
-from .base import get_category_impact
+from .base import DEBUG, format_bullets, get_category_impact
+
+# Cap on files fed to git analysis; larger changesets are truncated
+_MAX_ANALYZED_FILES = 1000
+
+# Analysis of an empty changeset never varies, so compute it once
+_EMPTY_DEV_CONTEXT = analyze_development_context([], [], None)
+
+# Static question sets for synthesize_development_open_questions
+_QUESTIONS_BY_AREA = {
+    'api': (
+        "Are there any breaking changes in the API modifications?",
+        "Do we need to version these API changes?",
+        "Have all authentication scenarios been tested?",
+        "Is the API documentation up to date?"
+    ),
+    'database': (
+        "Can these database changes be rolled back safely?",
+        "Have migrations been tested with production-like data?",
+        "Will these changes impact query performance?",
+        "Are there any data integrity concerns?"
+    ),
+    'frontend': (
+        "Have these changes been tested on mobile devices?",
+        "Are there any accessibility concerns with the UI changes?",
+        "Do these changes impact page load performance?",
+        "Are the UI patterns consistent with the rest of the application?"
+    )
+}
+
+_HIGH_IMPACT_QUESTIONS = (
+    "Should these high-impact changes be deployed gradually?",
+    "Do we have adequate monitoring for these changes?",
+    "Is there a rollback plan if issues arise?"
+)
+
+_DEFAULT_QUESTIONS = (
+    "Are there any potential integration issues with existing code?",
+    "Have all edge cases been considered and tested?", 
+    "Is additional documentation needed for these changes?",
+    "Are there performance implications to consider?"
+)
 
 def generate_development_stage_snapshot(thread_data, file_paths, recent_commits, repo_root, persona, enhanced_context):
     """Generate comprehensive development stage snapshot with git analysis"""
@@ -15,52 +58,61 @@ def generate_development_stage_snapshot(thread_data, file_paths, recent_commits,
         enhanced_context = {}
     
     # Analyze development context from git changes
-    dev_context = analyze_development_context(file_paths, recent_commits, repo_root)
+    if not file_paths and not recent_commits:
+        dev_context = copy.copy(_EMPTY_DEV_CONTEXT)
+    else:
+        dev_context = analyze_development_context(file_paths[:_MAX_ANALYZED_FILES], recent_commits, repo_root)
+    
+    # Full input sizes (the analysis may only see a prefix of the files)
+    dev_context['file_count'] = len(file_paths)
+    dev_context['commit_count'] = len(recent_commits)
     
     # Load development-specific template
-    try:
+    if DEBUG:
         rprint(f"[dim]🔍 Loading development template for: {persona}[/dim]")
-        
+    try:
         persona_config = template_loader.load_persona(f"{persona}")
+    except ValueError as e:
+        rprint(f"[red]❌ Could not load development template: {e}[/red]")
+        rprint(f"[red]❌ NO FALLBACK - Template file must exist![/red]")
+        raise ValueError(f"Missing required template file: {persona}") from e
+    if DEBUG:
         rprint(f"[green]✓ Successfully loaded development YML template[/green]")
         
         # DEBUG: Print development context analysis
         rprint(f"[dim]Detected work area: {dev_context.get('work_area', 'general')}[/dim]")
         rprint(f"[dim]Change impact: {dev_context.get('change_impact', 'medium')}[/dim]")
-        rprint(f"[dim]Modified files: {len(file_paths)} files[/dim]")
-        rprint(f"[dim]Recent commits: {len(recent_commits)} commits[/dim]")
-        
-        sections = {
-            'operator_instructions': synthesize_development_operator_instructions_with_template(
-                enhanced_context, persona, persona_config, dev_context
-            ),
-            'current_state': synthesize_development_current_state(
-                file_paths, recent_commits, dev_context, repo_root
-            ),
-            'decisions_constraints': synthesize_development_decisions_constraints_with_template(
-                enhanced_context, persona_config, dev_context
-            ),
-            'open_questions': synthesize_development_open_questions(
-                dev_context, file_paths, recent_commits
-            )
-        }
-        
-        # Merge domain-specific synthesis hints if domain is specified
-        domain = enhanced_context.get('domain')
-        if domain:
-            from ...interactive.domains import get_domain_synthesis_hints, merge_synthesis_hints
-            domain_hints = get_domain_synthesis_hints(domain)
-            if domain_hints:
+        rprint(f"[dim]Modified files: {dev_context['file_count']} files[/dim]")
+        rprint(f"[dim]Recent commits: {dev_context['commit_count']} commits[/dim]")
+    
+    sections = {
+        'operator_instructions': synthesize_development_operator_instructions_with_template(
+            enhanced_context, persona, persona_config, dev_context
+        ),
+        'current_state': synthesize_development_current_state(
+            file_paths, recent_commits, dev_context, repo_root
+        ),
+        'decisions_constraints': synthesize_development_decisions_constraints_with_template(
+            enhanced_context, persona_config, dev_context
+        ),
+        'open_questions': synthesize_development_open_questions(
+            dev_context, file_paths, recent_commits
+        )
+    }
+    
+    # Merge domain-specific synthesis hints if domain is specified
+    domain = enhanced_context.get('domain')
+    if domain:
+        from ...interactive.domains import get_domain_synthesis_hints, merge_synthesis_hints
+        domain_hints = get_domain_synthesis_hints(domain)
+        if domain_hints:
+            if DEBUG:
                 rprint(f"[dim]✓ Merging domain-specific guidance for: {domain}[/dim]")
-                sections = merge_synthesis_hints(sections, domain_hints)
-        
+            sections = merge_synthesis_hints(sections, domain_hints)
+    
+    if DEBUG:
         rprint(f"[green]✓ Development synthesis completed successfully[/green]")
-        return sections
-        
-    except Exception as e:
-        rprint(f"[red]❌ Could not load development template: {e}[/red]")
-        rprint(f"[red]❌ NO FALLBACK - Template file must exist![/red]")
-        raise ValueError(f"Missing required template file: {persona}")
+    return sections
 
 def synthesize_development_operator_instructions_with_template(enhanced_context, persona, persona_config, dev_context):
     """Generate development-focused operator instructions"""
@@ -75,53 +127,48 @@ def synthesize_development_operator_instructions_with_template(enhanced_context,
     task_priorities = persona_config.get('task_priorities', [])
     risk_factors = persona_config.get('risk_factors', [])
     
-    # Add context-specific guidelines
+    # Add context-specific guidelines (as new lists: persona_config is the
+    # loader's cached copy and must not grow across calls)
     dev_contexts = persona_config.get('development_contexts', {})
     if work_area in dev_contexts:
         context_specific = dev_contexts[work_area]
-        guidelines_do.extend(context_specific.get('specific_guidelines', []))
-        risk_factors.extend(context_specific.get('risk_factors', []))
+        guidelines_do = [*guidelines_do, *context_specific.get('specific_guidelines', [])]
+        risk_factors = [*risk_factors, *context_specific.get('risk_factors', [])]
     
     # Add recommendations from analysis
     recommendations = dev_context.get('recommendations', [])
     
-    # Build sections
-    do_section = '\n'.join([f"- {item}" for item in guidelines_do])
-    dont_section = '\n'.join([f"- {item}" for item in guidelines_dont])
-    tasks_section = '\n'.join([f"- {item}" for item in task_priorities])
-    risks_section = '\n'.join([f"- {item}" for item in risk_factors])
-    recommendations_section = '\n'.join([f"- {item}" for item in recommendations])
+    # Emit lines straight into one list; bullets go in without first being
+    # joined into per-section strings
+    parts = [
+        "## Operator Instructions",
+        "",
+        f"You are a **{persona_config.get('role', 'Senior Backend Developer')}** {persona_config.get('context', 'working on development tasks')}.",
+        "",
+        f"**Primary Focus**: {focus}",
+        f"**Development Area**: {work_area.title()} Development",
+        f"**Change Impact**: {dev_context.get('change_impact', 'medium').title()}",
+        "",
+        "### Guidelines",
+        "",
+        "**Do:**"
+    ]
+    _extend_bullets(parts, guidelines_do)
+    parts += ["", "**Don't:**"]
+    _extend_bullets(parts, guidelines_dont)
+    parts += ["", "### Development Tasks for This Session"]
+    _extend_bullets(parts, task_priorities)
+    parts += ["", "### Context-Specific Recommendations"]
+    _extend_bullets(parts, recommendations)
+    parts += ["", "### Expected Outputs", str(output), "", "### Risk Factors"]
+    _extend_bullets(parts, risk_factors)
+    parts += ["", "---", ""]
     
-    return f"""## Operator Instructions
-
-You are a **{persona_config.get('role', 'Senior Backend Developer')}** {persona_config.get('context', 'working on development tasks')}.
-
-**Primary Focus**: {focus}
-**Development Area**: {work_area.title()} Development
-**Change Impact**: {dev_context.get('change_impact', 'medium').title()}
+    return '\n'.join(parts)
 
-### Guidelines
-
-**Do:**
-{do_section}
-
-**Don't:**
-{dont_section}
-
-### Development Tasks for This Session
-{tasks_section}
-
-### Context-Specific Recommendations
-{recommendations_section}
-
-### Expected Outputs
-{output}
-
-### Risk Factors
-{risks_section}
-
----
-"""
+def _extend_bullets(parts, items):
+    """Append items as '- ' bullet lines (one blank line when there are none)"""
+    parts.extend([f"- {item}" for item in items] or [""])
 
 def synthesize_development_current_state(file_paths, recent_commits, dev_context, repo_root):
     """Generate current state analysis for development work"""
@@ -129,9 +176,10 @@ def synthesize_development_current_state(file_paths, recent_commits, dev_context
     work_area = dev_context.get('work_area', 'general')
     file_analysis = dev_context.get('file_analysis', {})
     commit_analysis = dev_context.get('commit_analysis', {})
+    file_count = dev_context.get('file_count', len(file_paths))
     
     # File summary
-    file_summary = f"**Modified Files**: {len(file_paths)} files across {work_area} area"
+    file_summary = f"**Modified Files**: {file_count} files across {work_area} area"
     
     # Recent work summary
     intent = commit_analysis.get('intent', 'general')
@@ -139,13 +187,16 @@ def synthesize_development_current_state(file_paths, recent_commits, dev_context
     work_summary = f"**Recent Work**: {commit_count} commits focused on {intent} work"
     
     # File breakdown
-    patterns = file_analysis.get('patterns', {})
-    breakdown_items = []
-    for area, count in patterns.items():
-        if count > 0 and area != 'other':
-            breakdown_items.append(f"- **{area.title()}**: {count} files")
+    breakdown_items = [
+        f"**{area.title()}**: {count} files"
+        for area, count in file_analysis.get('nonzero_categories', [])
+    ]
+    
+    breakdown = format_bullets(breakdown_items) or "- General development work"
     
-    breakdown = '\n'.join(breakdown_items) if breakdown_items else "- General development work"
+    truncation_note = ""
+    if file_count > _MAX_ANALYZED_FILES:
+        truncation_note = f"\n- Analysis limited to the first {_MAX_ANALYZED_FILES} of {file_count} files"
     
     return f"""## Current Development State
 
@@ -162,8 +213,8 @@ def synthesize_development_current_state(file_paths, recent_commits, dev_context
 
 ### Recent Activity
 - Last {commit_count} commits show {intent} work
-- {len(file_paths)} files modified in current session
-- Focus area: {work_area} development
+- {file_count} files modified in current session
+- Focus area: {work_area} development{truncation_note}
 
 """
 
@@ -173,59 +224,12 @@ def synthesize_development_decisions_constraints_with_template(enhanced_context,
     constraints = enhanced_context.get('constraints', 'best practices')
     work_area = dev_context.get('work_area', 'general')
     
-    # Load focus areas from template
+    # Build technical approach from template focus areas
     focus_areas = persona_config.get('focus_areas', [])
-    
-    # Build technical approach from context
-    approach_items = []
-    for area in focus_areas:
-        if 'quality' in area.lower():
-            approach_items.append("- **Code Quality**: Maintain consistency with existing codebase")
-        elif 'testing' in area.lower():
-            approach_items.append("- **Testing**: Comprehensive testing for all modifications")
-        elif 'documentation' in area.lower():
-            approach_items.append("- **Documentation**: Update docs to reflect changes")
-        elif 'integration' in area.lower():
-            approach_items.append("- **Integration**: Ensure compatibility with existing systems")
-        elif 'performance' in area.lower():
-            approach_items.append("- **Performance**: Monitor and optimize performance impact")
-        elif 'security' in area.lower():
-            approach_items.append("- **Security**: Review security implications of changes")
-    
-    approach_section = '\n'.join(approach_items)
+    approach_section = '\n'.join(_approach_items_for_focus(tuple(focus_areas)))
     
     # Development priorities based on context
-    priorities = []
-    if work_area == 'api':
-        priorities = [
-            "**API Compatibility**: Maintain backwards compatibility",
-            "**Testing**: Test all endpoints and edge cases", 
-            "**Documentation**: Update API documentation",
-            "**Performance**: Monitor response times and throughput"
-        ]
-    elif work_area == 'frontend':
-        priorities = [
-            "**User Experience**: Maintain consistent UI patterns",
-            "**Cross-Browser**: Test across different browsers",
-            "**Performance**: Optimize for mobile and desktop",
-            "**Accessibility**: Ensure accessibility compliance"
-        ]
-    elif work_area == 'database':
-        priorities = [
-            "**Data Integrity**: Ensure migration safety",
-            "**Performance**: Monitor query performance impact", 
-            "**Rollback**: Plan rollback strategies",
-            "**Testing**: Test migrations on staging data"
-        ]
-    else:
-        priorities = [
-            "**Code Quality**: Follow established patterns",
-            "**Testing**: Add comprehensive test coverage",
-            "**Integration**: Verify system integration",
-            "**Documentation**: Update relevant documentation"
-        ]
-    
-    priorities_section = '\n'.join([f"{i+1}. {priority}" for i, priority in enumerate(priorities)])
+    priorities_section = _PRIORITIES_SECTION_BY_AREA.get(work_area, _DEFAULT_PRIORITIES_SECTION)
     
     return f"""## Decisions & Constraints
 
@@ -237,6 +241,64 @@ def synthesize_development_decisions_constraints_with_template(enhanced_context,
 ## Development Priorities
 {priorities_section}"""
 
+# Focus-area keyword -> technical approach bullet; the first keyword found
+# in an area wins
+_APPROACH_BY_FOCUS_KEYWORD = (
+    ('quality', "- **Code Quality**: Maintain consistency with existing codebase"),
+    ('testing', "- **Testing**: Comprehensive testing for all modifications"),
+    ('documentation', "- **Documentation**: Update docs to reflect changes"),
+    ('integration', "- **Integration**: Ensure compatibility with existing systems"),
+    ('performance', "- **Performance**: Monitor and optimize performance impact"),
+    ('security', "- **Security**: Review security implications of changes")
+)
+
+@lru_cache(maxsize=16)
+def _approach_items_for_focus(focus_areas):
+    """Map template focus areas to technical approach bullets"""
+    approach_items = []
+    for area in focus_areas:
+        area_lower = area.lower()
+        for keyword, bullet in _APPROACH_BY_FOCUS_KEYWORD:
+            if keyword in area_lower:
+                approach_items.append(bullet)
+                break
+    return tuple(approach_items)
+
+# Development priorities by work area; other areas use the default list
+_PRIORITIES_BY_AREA = {
+    'api': (
+        "**API Compatibility**: Maintain backwards compatibility",
+        "**Testing**: Test all endpoints and edge cases",
+        "**Documentation**: Update API documentation",
+        "**Performance**: Monitor response times and throughput"
+    ),
+    'frontend': (
+        "**User Experience**: Maintain consistent UI patterns",
+        "**Cross-Browser**: Test across different browsers",
+        "**Performance**: Optimize for mobile and desktop",
+        "**Accessibility**: Ensure accessibility compliance"
+    ),
+    'database': (
+        "**Data Integrity**: Ensure migration safety",
+        "**Performance**: Monitor query performance impact",
+        "**Rollback**: Plan rollback strategies",
+        "**Testing**: Test migrations on staging data"
+    )
+}
+_DEFAULT_PRIORITIES = (
+    "**Code Quality**: Follow established patterns",
+    "**Testing**: Add comprehensive test coverage",
+    "**Integration**: Verify system integration",
+    "**Documentation**: Update relevant documentation"
+)
+
+def _numbered(items):
+    return '\n'.join(f"{i}. {item}" for i, item in enumerate(items, 1))
+
+# Numbered priority sections, rendered once
+_PRIORITIES_SECTION_BY_AREA = {area: _numbered(items) for area, items in _PRIORITIES_BY_AREA.items()}
+_DEFAULT_PRIORITIES_SECTION = _numbered(_DEFAULT_PRIORITIES)
+
 def synthesize_development_open_questions(dev_context, file_paths, recent_commits):
     """Generate context-aware open questions for development work"""
     
@@ -245,56 +307,26 @@ def synthesize_development_open_questions(dev_context, file_paths, recent_commit
     recommendations = dev_context.get('recommendations', [])
     risks = dev_context.get('risk_areas', [])
     
-    questions = []
-    
     # Add area-specific questions
-    if work_area == 'api':
-        questions.extend([
-            "Are there any breaking changes in the API modifications?",
-            "Do we need to version these API changes?",
-            "Have all authentication scenarios been tested?",
-            "Is the API documentation up to date?"
-        ])
-    elif work_area == 'database':
-        questions.extend([
-            "Can these database changes be rolled back safely?",
-            "Have migrations been tested with production-like data?",
-            "Will these changes impact query performance?",
-            "Are there any data integrity concerns?"
-        ])
-    elif work_area == 'frontend':
-        questions.extend([
-            "Have these changes been tested on mobile devices?",
-            "Are there any accessibility concerns with the UI changes?",
-            "Do these changes impact page load performance?",
-            "Are the UI patterns consistent with the rest of the application?"
-        ])
+    questions = list(_QUESTIONS_BY_AREA.get(work_area, ()))
     
     # Add risk-based questions
     if change_impact == 'high':
-        questions.extend([
-            "Should these high-impact changes be deployed gradually?",
-            "Do we have adequate monitoring for these changes?",
-            "Is there a rollback plan if issues arise?"
-        ])
+        questions.extend(_HIGH_IMPACT_QUESTIONS)
     
     # Add recommendation-based questions
     if len(recommendations) > 3:
         questions.append("Are there too many changes being made at once?")
     
-    if len(file_paths) > 8:
+    if dev_context.get('file_count', len(file_paths)) > 8:
         questions.append("Should this work be broken into smaller, more focused changes?")
     
     # Default questions if none specific
     if not questions:
-        questions = [
-            "Are there any potential integration issues with existing code?",
-            "Have all edge cases been considered and tested?", 
-            "Is additional documentation needed for these changes?",
-            "Are there performance implications to consider?"
-        ]
+        questions = list(_DEFAULT_QUESTIONS)
     
-    questions_section = '\n'.join([f"- {question}" for question in questions])
+    questions_section = format_bullets(questions)
+    risk_block = format_bullets(risks) or "- Standard development risks apply"
     
     return f"""## Open Questions & Considerations
 
@@ -302,7 +334,7 @@ def synthesize_development_open_questions(dev_context, file_paths, recent_commit
 {questions_section}
 
 ### Risk Assessment
-{chr(10).join([f"- {risk}" for risk in risks]) if risks else "- Standard development risks apply"}
+{risk_block}
 
 ### Next Steps
 - Review and address the questions above
@@ -5,6 +5,7 @@ No git analysis, pure YML template guidance
 from typing import Dict, Any
 from rich import print as rprint
 from ...templates.loader import template_loader
+from .base import DEBUG
 
 def generate_initial_stage_snapshot(thread_data, enhanced_context, persona, comprehensive=True):
     """Generate snapshot for initial/greenfield stage - no git analysis"""
@@ -46,7 +47,8 @@ def synthesize_initial_operator_instructions_with_template(enhanced_context, per
     try:
         template_name = f"{persona}"
         persona_config = template_loader.load_persona(template_name)
-        rprint(f"[dim]✓ Loaded comprehensive YML template: {template_name}[/dim]")
+        if DEBUG:
+            rprint(f"[dim]✓ Loaded comprehensive YML template: {template_name}[/dim]")
         
         # Extract CLI context
         focus = enhanced_context.get('focus', 'project setup')
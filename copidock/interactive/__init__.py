@@ -0,0 +1,22 @@
+# copidock/interactive/__init__.py
+"""Interactive CLI components for guided snapshot creation"""
+
+import importlib
+
+# Exported name -> defining submodule. Resolved on first access, so importing
+# one submodule (e.g. detection or domains) doesn't also load flow, with its
+# typer import and module-level Console.
+_EXPORTS = {
+    'DetectedContext': '.detection',
+    'auto_detect_context': '.detection',
+    'run_interactive_flow': '.flow',
+    'confirm_snapshot_creation': '.flow',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
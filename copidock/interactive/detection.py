@@ -1,123 +1,248 @@
 """Auto-detection and context analysis for intelligent snapshots"""
 
+import os
 import subprocess
-from typing import Dict, List, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 from pathlib import Path
-from datetime import datetime, timedelta
 import re
 
-def auto_detect_context(repo_root: Path, since: Optional[str] = None) -> Dict[str, Any]:
-    """Auto-detect repository context for smart defaults"""
+# Upper bound on commits read for detection; focus scoring gains little
+# from deeper history and long windows on busy repos stay cheap
+_MAX_DETECTED_COMMITS = 200
+
+# Focus area -> keywords matched against file paths and commit messages
+_FOCUS_KEYWORDS = {
+    'Infrastructure hardening': ['terraform', 'docker', 'deploy', '.tf', 'infra/', 'k8s/', 'helm/'],
+    'API debugging': ['api', 'endpoint', 'handler', 'lambda', 'routes', 'controllers/'],
+    'Database optimization': ['sql', 'database', 'db/', 'migration', 'schema', 'models/'],
+    'Frontend polish': ['ui/', 'components/', 'css', 'js', 'react', 'vue', 'angular', 'src/'],
+    'Testing improvements': ['test', 'spec', 'pytest', 'jest', 'coverage', '__tests__/'],
+    'Security hardening': ['auth', 'security', 'permission', 'oauth', 'jwt', 'ssl', 'crypto'],
+    'Performance optimization': ['cache', 'performance', 'optimization', 'benchmark', 'profiling'],
+    'Documentation updates': ['readme', 'docs/', 'documentation', '.md', 'wiki/'],
+    'Configuration management': ['config', 'settings', 'env', 'yaml', 'json', 'toml']
+}
+
+class DetectedContext(NamedTuple):
+    """Repository context detected from git, used for smart defaults"""
+    repo: str
+    branch: str
+    recent_commits: Tuple[Dict[str, str], ...]  # Last 3 for context
+    modified_files: Tuple[str, ...]  # Top 10 for display
+    detected_focus: str
+    suggested_output: str
+    detected_constraints: Tuple[str, ...]
+    file_count: int
+    commit_count: int
+
+# Detected contexts, keyed on (repo root, since) -> (detected at, context);
+# short-lived and small so a long-running process still sees new commits
+_CONTEXT_TTL_SECONDS = 60.0
+_CONTEXT_CACHE_SIZE = 8
+_context_cache: Dict[tuple, Tuple[float, DetectedContext]] = {}
+
+def auto_detect_context(repo_root: Path, since: Optional[str] = None) -> DetectedContext:
+    """Auto-detect repository context for smart defaults
     
-    # Get git information
-    repo_info = get_repo_info(repo_root)
+    Commands consult the context several times per run; calls within
+    _CONTEXT_TTL_SECONDS reuse the first detection unless COPIDOCK_NOCACHE=1
+    is set.
+    """
+    if os.environ.get('COPIDOCK_NOCACHE') == '1':
+        return _detect_context(repo_root, since)
     
-    # Analyze recent changes
-    time_filter = since or "3 days"
-    recent_commits = get_recent_commits(repo_root, time_filter)
-    modified_files = get_modified_files(repo_root)
+    key = (str(Path(repo_root).resolve()), since)
+    now = time.monotonic()
+    cached = _context_cache.get(key)
+    if cached is not None and now - cached[0] < _CONTEXT_TTL_SECONDS:
+        return cached[1]
     
-    # Detect focus areas from file patterns
-    detected_focus = detect_focus_from_changes(modified_files, recent_commits)
+    context = _detect_context(repo_root, since)
+    _context_cache.pop(key, None)
+    while len(_context_cache) >= _CONTEXT_CACHE_SIZE:
+        # Dicts keep insertion order, so the first entry is the oldest
+        del _context_cache[next(iter(_context_cache))]
+    _context_cache[key] = (now, context)
+    return context
+
+def _detect_context(repo_root: Path, since: Optional[str]) -> DetectedContext:
+    # The git queries are independent and block on subprocesses, so run
+    # them concurrently
+    time_filter = since or "3 days"
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # Get git information
+        repo_info_future = executor.submit(get_repo_info, repo_root)
+        
+        # Analyze recent changes
+        commits_future = executor.submit(
+            get_recent_commits, repo_root, time_filter, _MAX_DETECTED_COMMITS
+        )
+        modified_files_future = executor.submit(get_modified_files, repo_root)
+        
+        repo_info = repo_info_future.result()
+        recent_commits = commits_future.result()
+        modified_files = modified_files_future.result()
     
-    # Suggest output based on change patterns
-    suggested_output = suggest_output_from_patterns(modified_files, recent_commits)
+    # Detect focus areas and suggest output from file/commit patterns
+    detected_focus, suggested_output = _detect_patterns(
+        tuple(modified_files), tuple(commit.get('message', '') for commit in recent_commits)
+    )
     
     # Detect constraints from repo characteristics
     detected_constraints = detect_constraints_from_repo(repo_root, modified_files)
     
-    return {
-        'repo': repo_info.get('name', ''),
-        'branch': repo_info.get('branch', 'main'),
-        'recent_commits': recent_commits[:3],  # Last 3 for context
-        'modified_files': modified_files[:10],  # Top 10 for display
-        'detected_focus': detected_focus,
-        'suggested_output': suggested_output,
-        'detected_constraints': detected_constraints,
-        'file_count': len(modified_files),
-        'commit_count': len(recent_commits)
-    }
+    return DetectedContext(
+        repo=repo_info.get('name', ''),
+        branch=repo_info.get('branch', 'main'),
+        recent_commits=tuple(recent_commits[:3]),
+        modified_files=tuple(modified_files[:10]),
+        detected_focus=detected_focus,
+        suggested_output=suggested_output,
+        detected_constraints=tuple(detected_constraints),
+        file_count=len(modified_files),
+        commit_count=len(recent_commits)
+    )
+
+@lru_cache(maxsize=16)
+def _detect_patterns(modified_files: tuple, commit_messages: tuple) -> tuple:
+    """(focus area, suggested output) for a change set; both read only paths and messages"""
+    recent_commits = [{'message': message} for message in commit_messages]
+    return (
+        detect_focus_from_changes(modified_files, recent_commits),
+        suggest_output_from_patterns(modified_files, recent_commits)
+    )
+
+# Read-only queries: skip optional index locks/refreshes (so concurrent git
+# commands never contend), never prompt, and keep output untranslated
+_GIT_ENV_OVERRIDES = {'GIT_OPTIONAL_LOCKS': '0', 'GIT_TERMINAL_PROMPT': '0', 'LC_ALL': 'C'}
+
+# git emits UTF-8 (commit messages, -z paths) whatever the locale; decode it
+# as such and never let one bad byte discard a whole result
+_GIT_TEXT = {'encoding': 'utf-8', 'errors': 'replace'}
+
+def _git_env() -> Dict[str, str]:
+    return {**os.environ, **_GIT_ENV_OVERRIDES}
+
+def _git_command(args: List[str]) -> List[str]:
+    return ['git', '--no-optional-locks', *args]
+
+def _run_git(args: List[str], repo_root: Path) -> subprocess.CompletedProcess:
+    """Run a read-only git query and capture its output"""
+    return subprocess.run(
+        _git_command(args), cwd=repo_root, env=_git_env(), capture_output=True, **_GIT_TEXT
+    )
 
 def get_repo_info(repo_root: Path) -> Dict[str, str]:
     """Get basic repository information"""
     try:
-        # Get repo name from remote origin or directory name
-        result = subprocess.run(
-            ['git', 'remote', 'get-url', 'origin'], 
-            cwd=repo_root, 
-            capture_output=True, 
-            text=True
-        )
+        # One git call locates the metadata; branch and origin are then read
+        # from HEAD and config directly instead of spawning git for each
+        result = _run_git(['rev-parse', '--git-dir', '--git-common-dir'], repo_root)
+        if result.returncode != 0:
+            return {'name': repo_root.name, 'branch': 'main'}
+        git_dir, common_dir = (repo_root / line for line in result.stdout.splitlines()[:2])
         
-        if result.returncode == 0:
+        # Get repo name from remote origin or directory name
+        url = _read_origin_url(common_dir / 'config')
+        if url:
             # Extract repo name from URL
-            url = result.stdout.strip()
             repo_name = url.split('/')[-1].replace('.git', '')
         else:
             repo_name = repo_root.name
         
-        # Get current branch
-        result = subprocess.run(
-            ['git', 'branch', '--show-current'], 
-            cwd=repo_root, 
-            capture_output=True, 
-            text=True
-        )
-        branch = result.stdout.strip() if result.returncode == 0 else 'main'
+        # Get current branch (empty when HEAD is detached)
+        head = (git_dir / 'HEAD').read_text(encoding='utf-8').strip()
+        branch = head[len('ref: refs/heads/'):] if head.startswith('ref: refs/heads/') else ''
         
         return {'name': repo_name, 'branch': branch}
     
     except Exception:
         return {'name': repo_root.name, 'branch': 'main'}
 
-def get_recent_commits(repo_root: Path, since: str) -> List[Dict[str, str]]:
-    """Get recent commits for context analysis"""
+def _read_origin_url(config_path: Path) -> Optional[str]:
+    """Read remote.origin.url from a git config file"""
+    in_origin = False
+    for line in config_path.read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if line.startswith('['):
+            in_origin = re.fullmatch(r'\[remote\s+"origin"\]', line, re.IGNORECASE) is not None
+        elif in_origin and '=' in line:
+            key, value = line.split('=', 1)
+            if key.strip().lower() == 'url':
+                return value.strip().strip('"')
+    return None
+
+# git log fields, separated by US (0x1f); -z ends each record with NUL so
+# no subject or author text can break the parse
+_COMMIT_FIELDS = ('hash', 'message', 'author', 'time')
+_COMMIT_FORMAT = '--pretty=format:%H%x1f%s%x1f%an%x1f%ar'
+
+def get_recent_commits(repo_root: Path, since: str, max_count: Optional[int] = None) -> List[Dict[str, str]]:
+    """Get recent commits for context analysis (at most max_count when given)"""
+    args = ['log', '-z', f'--since={since}', _COMMIT_FORMAT]
+    if max_count is not None:
+        # Let git stop walking history as soon as it has enough commits
+        args.insert(1, f'-n{max_count}')
+    
     try:
-        result = subprocess.run([
-            'git', 'log', f'--since={since}', 
-            '--pretty=format:%H|%s|%an|%ar'
-        ], cwd=repo_root, capture_output=True, text=True)
+        commits = []
+        # Parse records as they arrive rather than buffering the whole output
+        with subprocess.Popen(
+            _git_command(args), cwd=repo_root, env=_git_env(),
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, **_GIT_TEXT
+        ) as proc:
+            for record in _iter_nul_records(proc.stdout):
+                fields = record.split('\x1f')
+                if len(fields) == 4:
+                    commit = dict(zip(_COMMIT_FIELDS, fields))
+                    commit['hash'] = commit['hash'][:8]
+                    commits.append(commit)
+                    if max_count is not None and len(commits) >= max_count:
+                        proc.terminate()
+                        return commits
         
-        if result.returncode != 0:
+        if proc.returncode != 0:
             return []
         
-        commits = []
-        for line in result.stdout.strip().split('\n'):
-            if line:
-                parts = line.split('|', 3)
-                if len(parts) == 4:
-                    commits.append({
-                        'hash': parts[0][:8],
-                        'message': parts[1],
-                        'author': parts[2],
-                        'time': parts[3]
-                    })
-        
         return commits
     
     except Exception:
         return []
 
+def _iter_nul_records(stream, chunk_size: int = 8192):
+    """Yield the non-empty NUL-separated records of a text stream"""
+    pending = ''
+    for chunk in iter(lambda: stream.read(chunk_size), ''):
+        *records, pending = (pending + chunk).split('\0')
+        yield from filter(None, records)
+    if pending:
+        yield pending
+
 def get_modified_files(repo_root: Path) -> List[str]:
     """Get list of modified files (staged + unstaged)"""
     try:
-        # Get staged files
-        result = subprocess.run([
-            'git', 'diff', '--cached', '--name-only'
-        ], cwd=repo_root, capture_output=True, text=True)
-        
-        staged_files = set(result.stdout.strip().split('\n')) if result.stdout.strip() else set()
+        # A single status call covers both the index and the work tree
+        result = _run_git(['status', '--porcelain=v2', '-z', '-uno'], repo_root)
         
-        # Get unstaged files
-        result = subprocess.run([
-            'git', 'diff', '--name-only'
-        ], cwd=repo_root, capture_output=True, text=True)
+        if result.returncode != 0:
+            return []
         
-        unstaged_files = set(result.stdout.strip().split('\n')) if result.stdout.strip() else set()
+        modified_files = []
+        entries = iter(result.stdout.split('\0'))
+        for entry in entries:
+            if entry.startswith('1 '):
+                modified_files.append(entry.split(' ', 8)[8])
+            elif entry.startswith('2 '):
+                # Renames/copies: keep the new path, skip the original
+                modified_files.append(entry.split(' ', 9)[9])
+                next(entries, None)
+            elif entry.startswith('u '):
+                modified_files.append(entry.split(' ', 10)[10])
         
-        # Combine and filter
-        all_files = staged_files.union(unstaged_files)
-        return [f for f in all_files if f and f != '']
+        return modified_files
     
     except Exception:
         return []
@@ -125,36 +250,23 @@ def get_modified_files(repo_root: Path) -> List[str]:
 def detect_focus_from_changes(modified_files: List[str], recent_commits: List[Dict]) -> str:
     """Intelligently detect focus area from file changes"""
     
-    patterns = {
-        'Infrastructure hardening': ['terraform', 'docker', 'deploy', '.tf', 'infra/', 'k8s/', 'helm/'],
-        'API debugging': ['api', 'endpoint', 'handler', 'lambda', 'routes', 'controllers/'],
-        'Database optimization': ['sql', 'database', 'db/', 'migration', 'schema', 'models/'],
-        'Frontend polish': ['ui/', 'components/', 'css', 'js', 'react', 'vue', 'angular', 'src/'],
-        'Testing improvements': ['test', 'spec', 'pytest', 'jest', 'coverage', '__tests__/'],
-        'Security hardening': ['auth', 'security', 'permission', 'oauth', 'jwt', 'ssl', 'crypto'],
-        'Performance optimization': ['cache', 'performance', 'optimization', 'benchmark', 'profiling'],
-        'Documentation updates': ['readme', 'docs/', 'documentation', '.md', 'wiki/'],
-        'Configuration management': ['config', 'settings', 'env', 'yaml', 'json', 'toml']
-    }
-    
-    # Score each pattern based on file matches
+    # Lowercase every text once; each side is also joined into one blob so a
+    # single substring check rules out keywords that appear nowhere
+    file_texts = [file_path.lower() for file_path in modified_files]
+    commit_texts = [commit.get('message', '').lower() for commit in recent_commits]
+    sources = (
+        (file_texts, '\0'.join(file_texts), 1),
+        (commit_texts, '\0'.join(commit_texts), 2)  # Commit messages weighted higher
+    )
+    
+    # Score each pattern: one hit per keyword per file path or message
     scores = {}
-    for focus_area, keywords in patterns.items():
+    for focus_area, keywords in _FOCUS_KEYWORDS.items():
         score = 0
-        
-        # Check modified files
-        for file_path in modified_files:
-            for keyword in keywords:
-                if keyword.lower() in file_path.lower():
-                    score += 1
-        
-        # Check commit messages (weighted higher)
-        for commit in recent_commits:
-            message = commit.get('message', '').lower()
-            for keyword in keywords:
-                if keyword.lower() in message:
-                    score += 2
-        
+        for keyword in keywords:
+            for texts, blob, weight in sources:
+                if keyword in blob:
+                    score += weight * sum(1 for text in texts if keyword in text)
         scores[focus_area] = score
     
     # Return highest scoring focus area, or default
@@ -166,17 +278,18 @@ def suggest_output_from_patterns(modified_files: List[str], recent_commits: List
     """Suggest expected output based on change patterns"""
     
     # Analyze file patterns
-    if any('test' in f.lower() for f in modified_files):
+    paths, lowered = _join_paths(modified_files)
+    if 'test' in lowered:
         return "Comprehensive test coverage"
-    elif any(f.endswith('.tf') or 'deploy' in f.lower() for f in modified_files):
+    elif '.tf\0' in paths or 'deploy' in lowered:
         return "Deployment plan"
-    elif any('api' in f.lower() or 'handler' in f.lower() or 'lambda' in f.lower() for f in modified_files):
+    elif 'api' in lowered or 'handler' in lowered or 'lambda' in lowered:
         return "Working API endpoint"
-    elif any('doc' in f.lower() or 'readme' in f.lower() for f in modified_files):
+    elif 'doc' in lowered or 'readme' in lowered:
         return "Updated documentation"
-    elif any('db' in f.lower() or 'migration' in f.lower() for f in modified_files):
+    elif 'db' in lowered or 'migration' in lowered:
         return "Database migration"
-    elif any('config' in f.lower() or f.endswith('.yml') or f.endswith('.yaml') for f in modified_files):
+    elif 'config' in lowered or '.yml\0' in paths or '.yaml\0' in paths:
         return "Configuration update"
     
     # Analyze commit messages
@@ -190,6 +303,18 @@ def suggest_output_from_patterns(modified_files: List[str], recent_commits: List
     
     return "Working implementation"
 
+# Root-level package manifests whose changes suggest cost sensitivity
+_PACKAGE_FILES = frozenset({'requirements.txt', 'package.json', 'Dockerfile'})
+
+def _join_paths(modified_files: List[str]):
+    """Join paths into NUL-terminated blobs (as given, and lowercased)
+    
+    Each keyword check is then one substring search instead of a pass over
+    the list, and a suffix check becomes a search for suffix + NUL.
+    """
+    paths = ''.join(f"{file_path}\0" for file_path in modified_files)
+    return paths, paths.lower()
+
 def detect_constraints_from_repo(repo_root: Path, modified_files: List[str]) -> List[str]:
     """Detect likely constraints from repository characteristics"""
     
@@ -199,20 +324,22 @@ def detect_constraints_from_repo(repo_root: Path, modified_files: List[str]) ->
     if any(f in str(repo_root).lower() for f in ['prod', 'production', 'live']):
         constraints.append('production stability')
     
+    paths, lowered = _join_paths(modified_files)
+    
     # Check for infrastructure files
-    if any(f.endswith('.tf') or 'docker' in f.lower() for f in modified_files):
+    if '.tf\0' in paths or 'docker' in lowered:
         constraints.append('infrastructure safety')
     
     # Check for API files
-    if any('api' in f.lower() or 'endpoint' in f.lower() for f in modified_files):
+    if 'api' in lowered or 'endpoint' in lowered:
         constraints.append('backward compatibility')
     
     # Check for database files
-    if any('db' in f.lower() or 'migration' in f.lower() for f in modified_files):
+    if 'db' in lowered or 'migration' in lowered:
         constraints.append('data integrity')
     
     # Check for package files (cost sensitivity)
-    if any(f in modified_files for f in ['requirements.txt', 'package.json', 'Dockerfile']):
+    if not _PACKAGE_FILES.isdisjoint(modified_files):
         constraints.append('cost optimization')
     
     # Default constraints if none detected
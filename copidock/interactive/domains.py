@@ -1,10 +1,26 @@
 """Domain template loading and management"""
 
+import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, List, Any
 from rich import print as rprint
 
+# Bundled domain templates, relative to this file
+_DOMAINS_DIR = Path(__file__).parent.parent / "templates" / "domains"
+
+# libyaml-backed loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Top-level keys that make up a template's header, and how much of the file
+# load_domain_header will read looking for them
+_HEADER_KEYS = frozenset({'domain', 'display_name', 'description'})
+_HEADER_MAX_BYTES = 4096
+
+# Domain names already looked up and found missing (warned about once)
+_missing_domains = set()
+
 
 def load_domain_template(domain_name: str) -> Optional[Dict[str, Any]]:
     """
@@ -14,25 +30,76 @@ def load_domain_template(domain_name: str) -> Optional[Dict[str, Any]]:
         domain_name: Name of the domain (e.g., 'pwa', 'healthcare')
     
     Returns:
-        Domain template dictionary or None if not found
+        Domain template dictionary or None if not found. Templates are parsed
+        once per process and shared between callers, so treat them as read-only.
     """
-    # Find templates directory relative to this file
-    templates_dir = Path(__file__).parent.parent / "templates" / "domains"
-    template_file = templates_dir / f"{domain_name}.yml"
-    
-    if not template_file.exists():
-        rprint(f"[yellow]Warning: Domain template '{domain_name}' not found[/yellow]")
+    if domain_name in _missing_domains:
         return None
     
     try:
-        with open(template_file, 'r') as f:
-            template = yaml.safe_load(f)
-        return template
+        return _parse_domain_template(_domain_file(domain_name))
+    except FileNotFoundError:
+        # Remember the miss so later lookups skip the open and the repeat warning
+        _missing_domains.add(domain_name)
+        rprint(f"[yellow]Warning: Domain template '{domain_name}' not found[/yellow]")
+        return None
     except Exception as e:
         rprint(f"[red]Error loading domain template '{domain_name}': {e}[/red]")
         return None
 
 
+@lru_cache(maxsize=64)
+def _domain_file(domain_name: str) -> Path:
+    """Path of a domain's template file (built once per name)"""
+    return _DOMAINS_DIR / f"{domain_name}.yml"
+
+
+@lru_cache(maxsize=None)
+def _parse_domain_template(template_file: Path) -> Optional[Dict[str, Any]]:
+    """Parse a domain template file (failures raise and are not cached)"""
+    # Raw bytes: the parser detects the encoding itself
+    with open(template_file, 'rb') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def load_domain_header(domain_name: str) -> Dict[str, Any]:
+    """
+    Load only the metadata header (domain, display_name, description) of a
+    domain template, without parsing its questions and synthesis hints.
+    
+    Args:
+        domain_name: Domain identifier
+    
+    Returns:
+        Header dictionary, empty if the template is missing or unreadable
+    """
+    template_file = _domain_file(domain_name)
+    try:
+        return _parse_domain_header(template_file)
+    except Exception:
+        return {}
+
+
+@lru_cache(maxsize=None)
+def _parse_domain_header(template_file: Path) -> Dict[str, Any]:
+    """Parse the leading header keys of a template file"""
+    lines = []
+    size = 0
+    with open(template_file, 'rb') as f:
+        for line in f:
+            # Stop at the first top-level key that is not part of the header
+            if line[:1].isalpha():
+                key = line.split(b':', 1)[0].decode('utf-8', 'replace').strip()
+                if key not in _HEADER_KEYS:
+                    break
+            size += len(line)
+            if size > _HEADER_MAX_BYTES:
+                break
+            lines.append(line)
+    header = yaml.load(b''.join(lines), Loader=_YAML_LOADER)
+    return header if isinstance(header, dict) else {}
+
+
 def list_available_domains() -> List[str]:
     """
     List all available domain templates.
@@ -40,16 +107,20 @@ def list_available_domains() -> List[str]:
     Returns:
         List of domain names (without .yml extension)
     """
-    templates_dir = Path(__file__).parent.parent / "templates" / "domains"
-    
-    if not templates_dir.exists():
-        return []
-    
-    domains = []
-    for template_file in templates_dir.glob("*.yml"):
-        domains.append(template_file.stem)
-    
-    return sorted(domains)
+    return list(_scan_domains())
+
+
+@lru_cache(maxsize=1)
+def _scan_domains() -> tuple:
+    """Domain names in the templates directory (it only changes on install)"""
+    try:
+        with os.scandir(_DOMAINS_DIR) as entries:
+            return tuple(sorted(
+                entry.name[:-len('.yml')] for entry in entries
+                if entry.name.endswith('.yml') and not entry.name.startswith('.') and entry.is_file()
+            ))
+    except FileNotFoundError:
+        return ()
 
 
 def get_domain_display_name(domain_name: str) -> str:
@@ -62,12 +133,26 @@ def get_domain_display_name(domain_name: str) -> str:
     Returns:
         Human-readable display name (e.g., 'Progressive Web App')
     """
-    template = load_domain_template(domain_name)
-    if template and 'display_name' in template:
-        return template['display_name']
+    header = load_domain_header(domain_name)
+    if 'display_name' not in header:
+        # Unusual layout (or missing file): fall back to the full parse
+        header = load_domain_template(domain_name) or {}
+    if 'display_name' in header:
+        return header['display_name']
     return domain_name.replace('-', ' ').title()
 
 
+def list_domain_display_names() -> Dict[str, str]:
+    """
+    Display names for every available domain, in one pass over the templates.
+    
+    Returns:
+        Mapping of domain identifier to human-readable display name, in
+        list_available_domains() order
+    """
+    return {name: get_domain_display_name(name) for name in _scan_domains()}
+
+
 def get_domain_questions(domain_name: str) -> List[Dict[str, str]]:
     """
     Get additional questions for a specific domain.
@@ -100,6 +185,14 @@ def get_domain_synthesis_hints(domain_name: str) -> Dict[str, str]:
     return {}
 
 
+@lru_cache(maxsize=256)
+def _format_section_header(section_name: str) -> str:
+    """Convert section_name to proper markdown header (memoized per name)"""
+    # Convert snake_case to Title Case
+    title = section_name.replace('_', ' ').title()
+    return f"## {title}\n\n"
+
+
 def merge_synthesis_hints(base_sections: Dict[str, str], domain_hints: Dict[str, str]) -> Dict[str, str]:
     """
     Merge domain-specific synthesis hints into base sections.
@@ -111,23 +204,17 @@ def merge_synthesis_hints(base_sections: Dict[str, str], domain_hints: Dict[str,
     Returns:
         Merged synthesis sections with proper markdown formatting
     """
-    merged = base_sections.copy()
-    
-    def format_section_header(section_name: str) -> str:
-        """Convert section_name to proper markdown header"""
-        # Convert snake_case to Title Case
-        title = section_name.replace('_', ' ').title()
-        return f"## {title}\n\n"
-    
+    # Split the hints in one pass: sections the persona already has get the
+    # domain guidance appended, the rest become new headed sections
+    appended = {}
+    added = {}
     for section_name, hint_content in domain_hints.items():
-        if section_name in merged:
-            # Append domain hints to existing section
-            merged[section_name] += f"\n\n### Domain-Specific Guidance\n\n{hint_content}"
+        if section_name in base_sections:
+            appended[section_name] = base_sections[section_name] + f"\n\n### Domain-Specific Guidance\n\n{hint_content}"
         else:
-            # Create new section from domain hints with proper header
-            merged[section_name] = format_section_header(section_name) + hint_content
+            added[section_name] = _format_section_header(section_name) + hint_content
     
-    return merged
+    return {**base_sections, **appended, **added}
 
 
 def display_domain_info(domain_name: str) -> None:
@@ -1,12 +1,57 @@
 """Interactive prompting flow for guided snapshot creation"""
 
+import os
 import typer
 from rich import print as rprint
+from rich.console import Console
+from rich.highlighter import ReprHighlighter
+from rich.text import Text
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Optional, Any, List
-from .prompts import prompt_multiline, prompt_single
+from .detection import DetectedContext
+from .prompts import prompt_multiline, prompt_multiline_batch, prompt_single
+
+# Persona templates shipped with the package; stage-specific variants
+# (name-<stage>.yml) are not offered for selection
+_PERSONAS_DIR = Path(__file__).parent.parent / "templates" / "personas"
+_STAGE_SUFFIXES = ('-initial', '-development', '-maintenance')
+_FALLBACK_PERSONAS = ("senior-backend-dev",)
+
+console = Console()
+
+
+def _static_text(markup: str) -> Text:
+    """Parse and highlight constant markup once, as console.print would for a str"""
+    return ReprHighlighter()(Text.from_markup(markup))
+
+
+# Constant parts of display_detected_context, rendered to Text once at import
+_INITIAL_BANNER = _static_text(
+    "[bold green]🌱 Welcome to Copidock![/bold green]\n"
+    "[dim]Let's define your project vision and create a comprehensive PRD foundation.[/dim]\n"
+)
+_INITIAL_GUIDANCE = _static_text(
+    "[dim]🎯 Mode: Initial setup - focus on business context and vision[/dim]\n"
+    "[dim]💡 Your input will guide AI to generate the complete PRD[/dim]\n\n"
+    "✨ Let's establish the business context for your project:\n"
+)
+_DEVELOPMENT_BANNER = _static_text(
+    "[bold blue]🔧 Development Session Snapshot[/bold blue]\n"
+    "[dim]Using recent git activity to suggest context...[/dim]\n"
+)
+_RECENT_COMMITS_HEADING = _static_text("\n[dim]📝 Recent commits:[/dim]")
+_MODIFIED_FILES_HEADING = _static_text("\n[dim]📄 Key modified files:[/dim]")
+_REVIEW_FOOTER = _static_text("\n[dim]💭 Review the suggestions below and adjust as needed:[/dim]\n")
+
+# Stage -> (banner above the repo line, closing text); unknown stages use development
+_STAGE_BANNERS = {
+    "initial": (_INITIAL_BANNER, _INITIAL_GUIDANCE),
+    "development": (_DEVELOPMENT_BANNER, _REVIEW_FOOTER),
+}
 
 def run_interactive_flow(
-    context: Dict[str, Any], 
+    context: DetectedContext, 
     default_persona: str, 
     default_focus: Optional[str], 
     default_output: Optional[str], 
@@ -21,45 +66,43 @@ def run_interactive_flow(
     
     # Interactive prompts with smart defaults (stage-aware)
     if stage == "initial":
-        # Initial stage - business/vision-focused prompts
-        focus = prompt_multiline(
-            "🎯 What are you trying to build or achieve?",
-            default=default_focus or "New application",
-            help_text="Describe the project vision, problem you're solving, or value you're creating"
-        )
-        
-        output = prompt_multiline(
-            "🏆 What does success look like?",
-            default=default_output or "Working MVP",
-            help_text="Describe in a few lines what you're expecting from this implementation - high-level outcomes"
-        )
-        
-        constraints = prompt_multiline(
-            "⚡ What are your project constraints or guardrails?",
-            default=default_constraints or "best practices",
-            help_text="e.g., budget limits, technology preferences, timeline, performance requirements, team size"
-        )
+        # Initial stage - business/vision-focused prompts, answered in one editor session
+        answers = prompt_multiline_batch([
+            ('focus', "🎯 What are you trying to build or achieve?",
+             default_focus or "New application",
+             "Describe the project vision, problem you're solving, or value you're creating"),
+            ('output', "🏆 What does success look like?",
+             default_output or "Working MVP",
+             "Describe in a few lines what you're expecting from this implementation - high-level outcomes"),
+            ('constraints', "⚡ What are your project constraints or guardrails?",
+             default_constraints or "best practices",
+             "e.g., budget limits, technology preferences, timeline, performance requirements, team size"),
+        ])
+        focus = answers['focus']
+        output = answers['output']
+        constraints = answers['constraints']
         
     else:
         # Development stage - implementation-focused prompts with git context
         focus = prompt_with_smart_default(
             "🎯 What are you trying to achieve in this session?",
-            default_focus or context['detected_focus'],
-            context['detected_focus'],
+            default_focus or context.detected_focus,
+            context.detected_focus,
             help_text="Current implementation goal - what you're building or NOT trying to build"
         )
         
         output = prompt_with_smart_default(
             "🏆 What's the expected outcome?",
-            default_output or context['suggested_output'],
-            context['suggested_output'],
+            default_output or context.suggested_output,
+            context.suggested_output,
             help_text="Describe what working implementation looks like for this session"
         )
         
+        detected_constraints = ", ".join(context.detected_constraints)
         constraints = prompt_with_smart_default(
             "⚡ What constraints are guiding this work?",
-            default_constraints or ", ".join(context['detected_constraints']),
-            ", ".join(context['detected_constraints']),
+            default_constraints or detected_constraints,
+            detected_constraints,
             help_text="e.g., must maintain backwards compatibility, performance targets, code style requirements"
         )
     
@@ -101,46 +144,37 @@ def run_interactive_flow(
     
     return result
 
-def display_detected_context(context: Dict[str, Any], stage: str = "development") -> None:
+def display_detected_context(context: DetectedContext, stage: str = "development") -> None:
     """Display auto-detected context information - stage aware"""
     
-    if stage == "initial":
-        # Greenfield project - welcoming message
-        rprint("[bold green]🌱 Welcome to Copidock![/bold green]")
-        rprint("[dim]Let's define your project vision and create a comprehensive PRD foundation.[/dim]\n")
-        
-        # Show minimal repo info only
-        rprint(f"[dim]📁 Repository: {context.get('repo', 'unknown')} (branch: {context.get('branch', 'main')})[/dim]")
-        rprint("[dim]🎯 Mode: Initial setup - focus on business context and vision[/dim]")
-        rprint("[dim]💡 Your input will guide AI to generate the complete PRD[/dim]\n")
-        
-        rprint("✨ Let's establish the business context for your project:\n")
-        
-    else:
-        # Development stage - show git analysis
-        rprint("[bold blue]🔧 Development Session Snapshot[/bold blue]")
-        rprint("[dim]Using recent git activity to suggest context...[/dim]\n")
-        
-        rprint(f"[dim]📁 Repository: {context['repo']} (branch: {context['branch']})[/dim]")
-        rprint(f"[dim]📊 Recent activity: {context['commit_count']} commits, {context['file_count']} files modified[/dim]")
+    # Collect the lines and render them with a single print; the constant
+    # banners are pre-parsed Text, only the per-run lines go through markup.
+    # Greenfield (initial) projects get a welcome and minimal repo info only;
+    # every other stage gets the git analysis
+    banner, closing = _STAGE_BANNERS.get(stage, _STAGE_BANNERS["development"])
+    lines = [banner, f"[dim]📁 Repository: {context.repo} (branch: {context.branch})[/dim]"]
+    
+    if stage != "initial":
+        lines.append(f"[dim]📊 Recent activity: {context.commit_count} commits, {context.file_count} files modified[/dim]")
         
         # Show recent commits for context
-        if context['recent_commits']:
-            rprint("\n[dim]📝 Recent commits:[/dim]")
-            for commit in context['recent_commits'][:2]:  # Show top 2
-                rprint(f"[dim]  • {commit['hash']}: {commit['message'][:50]}... ({commit['time']})[/dim]")
+        if context.recent_commits:
+            lines.append(_RECENT_COMMITS_HEADING)
+            for commit in context.recent_commits[:2]:  # Show top 2
+                lines.append(f"[dim]  • {commit['hash']}: {commit['message'][:50]}... ({commit['time']})[/dim]")
         
         # Show key modified files
-        if context['modified_files']:
-            rprint("\n[dim]📄 Key modified files:[/dim]")
-            for file_path in context['modified_files'][:3]:  # Show top 3
-                rprint(f"[dim]  • {file_path}[/dim]")
+        if context.modified_files:
+            lines.append(_MODIFIED_FILES_HEADING)
+            for file_path in context.modified_files[:3]:  # Show top 3
+                lines.append(f"[dim]  • {file_path}[/dim]")
             
-            if len(context['modified_files']) > 3:
-                remaining = len(context['modified_files']) - 3
-                rprint(f"[dim]  ... and {remaining} more files[/dim]")
-        
-        rprint("\n[dim]💭 Review the suggestions below and adjust as needed:[/dim]\n")
+            if len(context.modified_files) > 3:
+                remaining = len(context.modified_files) - 3
+                lines.append(f"[dim]  ... and {remaining} more files[/dim]")
+    
+    lines.append(closing)
+    console.print(*lines, sep="\n")
 
 def prompt_with_smart_default(
     prompt_text: str, 
@@ -160,7 +194,7 @@ def prompt_with_smart_default(
         rprint(f"[dim]💡 Suggested from recent changes: \"{detected_value}\"[/dim]\n")
         return prompt_multiline(prompt_text, default=detected_value, help_text=help_text)
 
-def confirm_snapshot_creation(stage: str,params: Dict[str, str], context: Dict[str, Any]) -> bool:
+def confirm_snapshot_creation(stage: str,params: Dict[str, str], context: DetectedContext) -> bool:
     """Show summary and confirm snapshot creation"""
     
     rprint("\n[blue]> Summary:[/blue]")
@@ -170,47 +204,47 @@ def confirm_snapshot_creation(stage: str,params: Dict[str, str], context: Dict[s
     rprint(f"  [bold]Persona:[/bold] {params['persona']}")
     
     if stage != "initial":
-        rprint(f"  [bold]Auto-detected files:[/bold] {context['file_count']} (filtered, ≤6k tokens)")
+        rprint(f"  [bold]Auto-detected files:[/bold] {context.file_count} (filtered, ≤6k tokens)")
     
-    if stage != "initial" and context['recent_commits']:
-        print(f"  [bold]Recent commits:[/bold] {len(context['recent_commits'])} included")
+    if stage != "initial" and context.recent_commits:
+        print(f"  [bold]Recent commits:[/bold] {len(context.recent_commits)} included")
     
     rprint()
     return typer.confirm("Proceed with snapshot creation?", default=True)
 
 def get_available_personas() -> List[str]:
     """Get list of available personas for selection"""
-    # This integrates with your actual template directory
+    return list(_scan_personas())
+
+@lru_cache(maxsize=1)
+def _scan_personas() -> tuple:
+    """Base persona names in the bundled templates (stage variants excluded)"""
     try:
-        from pathlib import Path
-        personas_dir = Path("copidock/templates/personas")
-        
-        if personas_dir.exists():
-            available_personas = []
-            for yml_file in personas_dir.glob("*.yml"):
-                # Extract base persona name (remove stage suffixes)
-                name = yml_file.stem
-                if not name.endswith(('-initial', '-development', '-maintenance')):
-                    available_personas.append(name)
-            return sorted(set(available_personas))
-        return ["senior-backend-dev"]  # fallback
-    except Exception:
-        return ["senior-backend-dev"]  # fallback
+        with os.scandir(_PERSONAS_DIR) as entries:
+            return tuple(sorted({
+                entry.name[:-len('.yml')] for entry in entries
+                if entry.name.endswith('.yml') and not entry.name.startswith('.')
+                and not entry.name[:-len('.yml')].endswith(_STAGE_SUFFIXES)
+            })) or _FALLBACK_PERSONAS
+    except OSError:
+        return _FALLBACK_PERSONAS
 
 def interactive_persona_selection(default_persona: str) -> str:
     """Interactive persona selection with descriptions"""
     
     personas = get_available_personas()
+    # Position of the default, looked up once (first entry if it isn't listed)
+    default_number = {persona: i for i, persona in enumerate(personas, 1)}.get(default_persona, 1)
     
     rprint("[blue]Available personas:[/blue]")
     for i, persona in enumerate(personas, 1):
-        marker = "[green]→[/green]" if persona == default_persona else " "
+        marker = "[green]→[/green]" if i == default_number else " "
         rprint(f"{marker} {i}. {persona}")
     
     rprint()
     choice = typer.prompt(
         f"Select persona (1-{len(personas)}) or press Enter for default",
-        default=str(personas.index(default_persona) + 1),
+        default=str(default_number),
         type=str
     )
     
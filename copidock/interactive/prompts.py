@@ -1,10 +1,27 @@
 """Enhanced prompt input handlers for interactive CLI"""
 
-import click
 import os
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from rich import print as rprint
 
+# Marks the start of each field in a batched editor buffer
+_SECTION_MARKER = "# --- {} ---"
+
+
+def _click():
+    """click, imported only once the CLI actually prompts"""
+    import click
+    return click
+
+
+def _editor_mode(use_editor: Optional[bool]) -> bool:
+    """Resolve editor vs inline mode (explicit flag, then COPIDOCK_EDITOR_MODE)"""
+    if use_editor is None:
+        # Check environment variable
+        editor_mode = os.environ.get('COPIDOCK_EDITOR_MODE', 'editor').lower()
+        use_editor = editor_mode != 'inline'
+    return use_editor
+
 
 def prompt_multiline(
     prompt_text: str,
@@ -40,13 +57,7 @@ def prompt_multiline(
         Set COPIDOCK_EDITOR_MODE=inline to disable editor globally
     """
     
-    # Determine editor mode
-    if use_editor is None:
-        # Check environment variable
-        editor_mode = os.environ.get('COPIDOCK_EDITOR_MODE', 'editor').lower()
-        use_editor = editor_mode != 'inline'
-    
-    if use_editor:
+    if _editor_mode(use_editor):
         # Show prompt for editor mode
         default_hint = f" [{default}]" if default else ""
         rprint(f"\n[bold]{prompt_text}{default_hint}[/bold]")
@@ -55,17 +66,15 @@ def prompt_multiline(
         rprint("[dim]> Opening editor for multiline input... (save and close when done)[/dim]")
         
         # Prepare initial content with helpful comment
-        initial_text = f"# {prompt_text}\n"
+        header = [f"# {prompt_text}"]
         if help_text:
-            initial_text += f"# {help_text}\n"
-        initial_text += "# Enter your text below. Lines starting with # will be ignored.\n"
-        initial_text += "# Save and close the editor when done.\n\n"
-        
-        if default:
-            initial_text += f"{default}\n"
+            header.append(f"# {help_text}")
+        header.append("# Enter your text below. Lines starting with # will be ignored.")
+        header.append("# Save and close the editor when done.")
+        initial_text = "\n".join(header) + (f"\n\n{default}\n" if default else "\n\n")
         
         # Open editor
-        result = click.edit(initial_text)
+        result = _click().edit(initial_text)
         
         # Process result
         if result is None or result.strip() == "":
@@ -76,11 +85,17 @@ def prompt_multiline(
                 rprint("[yellow]⚠ No input provided[/yellow]\n")
                 return ""
         
-        # Remove comment lines and clean up
-        lines = [line for line in result.split('\n') if not line.strip().startswith('#')]
+        # Remove comment lines and clean up, counting non-blank lines in the same pass
+        lines = []
+        line_count = 0
+        for line in result.splitlines():
+            if line.lstrip().startswith('#'):
+                continue
+            lines.append(line)
+            if line.strip():
+                line_count += 1
         cleaned = '\n'.join(lines).strip()
         
-        line_count = len([l for l in lines if l.strip()])
         rprint(f"[green]✓ Captured {line_count} line{'s' if line_count != 1 else ''}[/green]\n")
         
         return cleaned
@@ -90,7 +105,74 @@ def prompt_multiline(
         rprint(f"\n[bold]{prompt_text}[/bold]")
         if help_text:
             rprint(f"[dim]{help_text}[/dim]")
-        return click.prompt("", default=default or "", show_default=True)
+        return _click().prompt("", default=default or "", show_default=True)
+
+
+def prompt_multiline_batch(
+    fields: List[Tuple[str, str, Optional[str], Optional[str]]],
+    use_editor: Optional[bool] = None
+) -> Dict[str, str]:
+    """
+    Capture several multiline answers in a single editor session.
+    
+    Each field gets its own marked section in one buffer, so the editor is
+    opened once rather than once per question. In inline mode this falls
+    back to prompting for each field in turn.
+    
+    Args:
+        fields: (key, prompt_text, default, help_text) for each answer
+        use_editor: Override editor mode (True=editor, False=inline, None=auto-detect)
+    
+    Returns:
+        Answers keyed by field key; empty or removed sections use their default
+    """
+    if not _editor_mode(use_editor):
+        return {
+            key: prompt_multiline(prompt_text, default=default, use_editor=False, help_text=help_text)
+            for key, prompt_text, default, help_text in fields
+        }
+    
+    for _, prompt_text, default, help_text in fields:
+        default_hint = f" [{default}]" if default else ""
+        rprint(f"\n[bold]{prompt_text}{default_hint}[/bold]")
+        if help_text:
+            rprint(f"[dim]{help_text}[/dim]")
+    rprint("[dim]> Opening editor for multiline input... (save and close when done)[/dim]")
+    
+    # One section per field, each headed by its marker line and prompt comments
+    parts = [
+        "# Answer each section below. Lines starting with # will be ignored.",
+        "# Keep the '# --- name ---' lines; save and close the editor when done.",
+    ]
+    for key, prompt_text, default, help_text in fields:
+        parts.append("")
+        parts.append(_SECTION_MARKER.format(key))
+        parts.append(f"# {prompt_text}")
+        if help_text:
+            parts.append(f"# {help_text}")
+        if default:
+            parts.append(default)
+    
+    result = _click().edit("\n".join(parts) + "\n")
+    
+    # Split the buffer back into fields on the marker lines
+    markers = {_SECTION_MARKER.format(key): key for key, _, _, _ in fields}
+    collected: Dict[str, List[str]] = {}
+    current = None
+    for line in (result or "").splitlines():
+        stripped = line.strip()
+        if stripped in markers:
+            current = markers[stripped]
+            collected[current] = []
+        elif current is not None and not line.lstrip().startswith('#'):
+            collected[current].append(line)
+    
+    answers = {}
+    for key, _, default, _ in fields:
+        answers[key] = '\n'.join(collected.get(key, ())).strip() or (default or "")
+    
+    rprint(f"[green]✓ Captured {len(fields)} answers[/green]\n")
+    return answers
 
 
 def prompt_single(
@@ -107,4 +189,4 @@ def prompt_single(
     Returns:
         User input string
     """
-    return click.prompt(prompt_text, default=default or "", show_default=True)
+    return _click().prompt(prompt_text, default=default or "", show_default=True)
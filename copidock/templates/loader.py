@@ -1,17 +1,31 @@
 # copidock/templates/loader.py
 import yaml
 import os
+from collections import ChainMap
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+# libyaml-backed loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# File categories that can select a persona's template rule, most important first
+_CATEGORY_PRIORITY = ('Infrastructure', 'Backend/Lambda', 'Frontend', 'Tests', 'Configuration', 'Documentation')
+
 class TemplateLoader:
     def __init__(self):
         self.templates_dir = Path(__file__).parent
         self.personas_dir = self.templates_dir / "personas"
         self.sections_dir = self.templates_dir / "sections"
         
-        # Cache loaded personas
-        self._persona_cache = {}
+        # Per-instance memoization, bounded so arbitrary names and inputs
+        # can't grow it forever (and dropped along with the loader)
+        self._load_persona_cached = lru_cache(maxsize=64)(self._load_persona)
+        self._resolve_template_vars_cached = lru_cache(maxsize=512)(self._resolve_template_vars)
+        self._matched_rule = lru_cache(maxsize=256)(self._match_rule)
+        self._goal_modifiers = lru_cache(maxsize=64)(self._compile_goal_modifiers)
+        # (personas dir mtime, persona names) for existence checks
+        self._persona_names = None
     
     def list_personas(self) -> List[str]:
         """List available persona templates"""
@@ -21,112 +35,157 @@ class TemplateLoader:
         return sorted(personas)
     
     def load_persona(self, persona_name: str) -> Dict[str, Any]:
-        """Load persona template configuration"""
-        if persona_name in self._persona_cache:
-            return self._persona_cache[persona_name]
-        
+        """Load persona template configuration (cached; callers must not mutate it)"""
+        return self._load_persona_cached(persona_name)
+    
+    def _load_persona(self, persona_name: str) -> Dict[str, Any]:
+        """Parse a persona file (memoized per loader as _load_persona_cached)"""
         persona_file = self.personas_dir / f"{persona_name}.yml"
         if not persona_file.exists():
             raise ValueError(f"Persona template '{persona_name}' not found")
         
         try:
-            with open(persona_file, 'r', encoding='utf-8') as f:
-                persona_config = yaml.safe_load(f)
+            # Raw bytes: the parser detects and decodes UTF-8 itself
+            with open(persona_file, 'rb') as f:
+                persona_config = yaml.load(f, Loader=_YAML_LOADER)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in persona '{persona_name}': {e}")
         except Exception as e:
             raise ValueError(f"Error loading persona '{persona_name}': {e}")
         
-        self._persona_cache[persona_name] = persona_config
         return persona_config
     
     def resolve_template_vars(self, persona_name: str, thread_data: Dict[str, Any], 
                          file_categories: Dict[str, List[str]], enhanced_context: Optional[Dict] = None) -> Dict[str, Any]:
         """Resolve template variables using persona rules"""
-        persona = self.load_persona(persona_name)
         goal = thread_data.get('goal', 'development task')
         
         # Handle enhanced context safely
         if enhanced_context is None:
             enhanced_context = {}
         
+        # Only these inputs affect the result: which priority categories are
+        # present (not their files) and the three enhanced-context overrides
+        args = (
+            persona_name,
+            goal,
+            thread_data.get('repo', 'project'),
+            thread_data.get('branch', 'main'),
+            tuple(category for category in _CATEGORY_PRIORITY if category in file_categories),
+            enhanced_context.get('focus'),
+            enhanced_context.get('output'),
+            enhanced_context.get('constraints'),
+        )
+        try:
+            template_vars = self._resolve_template_vars_cached(*args)
+        except TypeError:
+            # Unhashable override values: resolve without the cache
+            template_vars = self._resolve_template_vars(*args)
+        # Fresh top-level dict per call so callers can adjust it freely
+        return dict(template_vars)
+    
+    def _resolve_template_vars(self, persona_name: str, goal: str, repo: str, branch: str,
+                               categories: tuple, focus: Any, output: Any, constraints: Any) -> Dict[str, Any]:
+        """Build template variables from the persona and the inputs that matter"""
+        persona = self.load_persona(persona_name)
+        
         # Base template vars
-        template_vars = {
+        base_vars = {
             'goal': goal,
-            'repo': thread_data.get('repo', 'project'),
-            'branch': thread_data.get('branch', 'main'),
+            'repo': repo,
+            'branch': branch,
             'persona_name': persona.get('name', 'Developer')
         }
         
-        # Find matching rule based on file categories
-        template_rules = persona.get('template_rules', {})
-        
-        # Try to find specific category match (prioritize by importance)
-        matched_rule = None
-        category_priority = ['Infrastructure', 'Backend/Lambda', 'Frontend', 'Tests', 'Configuration', 'Documentation']
-        
-        for category in category_priority:
-            if category in file_categories and category in template_rules:
-                matched_rule = template_rules[category].copy()
-                break
-        
-        # Fall back to default rule
-        if not matched_rule:
-            matched_rule = template_rules.get('default', {}).copy()
-        
-        # Apply the matched rule
-        template_vars.update(matched_rule)
+        # Apply the matched rule over the base vars without copying either;
+        # every write below lands in the fresh top layer, never in the persona
+        template_vars = ChainMap({}, self._matched_rule(persona_name, categories), base_vars)
         
         # Apply goal-specific modifiers
-        self._apply_goal_modifiers(template_vars, persona, goal)
+        self._apply_goal_modifiers(template_vars, self._goal_modifiers(persona_name), goal)
         
         # **NEW: Apply enhanced context overrides**
-        if enhanced_context.get('focus'):
-            template_vars['primary_focus'] = enhanced_context['focus']
-        if enhanced_context.get('output'):
-            template_vars['expected_outputs'] = enhanced_context['output']
-        if enhanced_context.get('constraints'):
-            template_vars['constraints'] = enhanced_context['constraints']
+        if focus:
+            template_vars['primary_focus'] = focus
+        if output:
+            template_vars['expected_outputs'] = output
+        if constraints:
+            template_vars['constraints'] = constraints
         
         # Handle task_list formatting
         if isinstance(template_vars.get('task_list'), list):
             template_vars['task_list'] = '\n'.join(f"- {task}" for task in template_vars['task_list'])
         
-        return template_vars
+        return dict(template_vars)
             
-    def _apply_goal_modifiers(self, template_vars: Dict[str, Any], persona: Dict[str, Any], goal: str):
+    def _match_rule(self, persona_name: str, categories: tuple) -> Dict[str, Any]:
+        """Template rule for a persona and set of file categories (memoized as _matched_rule; read-only)"""
+        template_rules = self.load_persona(persona_name).get('template_rules', {})
+        
+        # Try to find specific category match (categories are in priority order)
+        matched_rule = None
+        
+        for category in categories:
+            if category in template_rules:
+                matched_rule = template_rules[category]
+                break
+        
+        # Fall back to default rule
+        if not matched_rule:
+            matched_rule = template_rules.get('default', {})
+        return matched_rule
+    
+    def _compile_goal_modifiers(self, persona_name: str) -> List[tuple]:
+        """Persona goal modifiers, pre-split into (keywords, [(action, key, value)])"""
+        compiled = []
+        for pattern, modifiers in self.load_persona(persona_name).get('goal_modifiers', {}).items():
+            actions = []
+            for key, value in modifiers.items():
+                if key.endswith('_append'):
+                    actions.append(('append', key.replace('_append', ''), value))
+                elif key.endswith('_override'):
+                    actions.append(('set', key.replace('_override', ''), value))
+                else:
+                    actions.append(('set', key, value))
+            compiled.append((tuple(pattern.split('|')), actions))
+        return compiled
+    
+    def _apply_goal_modifiers(self, template_vars: Dict[str, Any], goal_modifiers: List[tuple], goal: str):
             """Apply goal-specific modifiers to template variables"""
-            goal_modifiers = persona.get('goal_modifiers', {})
             goal_lower = goal.lower()
             
-            for pattern, modifiers in goal_modifiers.items():
-                if any(keyword in goal_lower for keyword in pattern.split('|')):
-                    for key, value in modifiers.items():
-                        if key.endswith('_append'):
-                            base_key = key.replace('_append', '')
-                            if base_key in template_vars:
-                                if isinstance(template_vars[base_key], str):
-                                    template_vars[base_key] += value
-                                elif isinstance(template_vars[base_key], list) and isinstance(value, list):
-                                    template_vars[base_key].extend(value)
-                        elif key.endswith('_override'):
-                            base_key = key.replace('_override', '')
-                            template_vars[base_key] = value
-                        else:
+            for keywords, actions in goal_modifiers:
+                if any(keyword in goal_lower for keyword in keywords):
+                    for action, key, value in actions:
+                        if action == 'set':
                             template_vars[key] = value
+                        elif key in template_vars:
+                            if isinstance(template_vars[key], str):
+                                template_vars[key] += value
+                            elif isinstance(template_vars[key], list) and isinstance(value, list):
+                                # New list: the old one is shared with the cached persona
+                                template_vars[key] = template_vars[key] + value
     # In copidock/templates/loader.py
 
     def load_template_with_stage(self, persona: str, stage: str, context: Dict, enhanced_context: Dict) -> str:
         """Load template variant based on project stage"""
         
-        # Try stage-specific template first
+        # Try stage-specific template first, else fall back to the default one
         stage_specific_persona = f"{persona}-{stage}"
         
-        try:
+        if self._persona_exists(stage_specific_persona):
             return self.load_template(stage_specific_persona, context, enhanced_context)
-        except:
-            # Fallback to default template - no error message for now
-            return self.load_template(persona, context, enhanced_context)
+        return self.load_template(persona, context, enhanced_context)
+    
+    def _persona_exists(self, persona_name: str) -> bool:
+        """Whether a persona template exists; the listing is re-read only when the directory changes"""
+        try:
+            dir_mtime = self.personas_dir.stat().st_mtime
+        except OSError:
+            return False
+        if self._persona_names is None or self._persona_names[0] != dir_mtime:
+            self._persona_names = (dir_mtime, frozenset(self.list_personas()))
+        return persona_name in self._persona_names[1]
     
     def load_template(self, persona: str, context: Dict, enhanced_context: Dict) -> str:
         """Load and render template - simplified for now"""
@@ -134,22 +193,22 @@ class TemplateLoader:
         # For now, return a simple stage-aware template
         stage = enhanced_context.get('stage', 'development')
         focus = enhanced_context.get('focus', 'development tasks')
-        
-        if stage == "initial":
-            return f"""## Stage: {stage.upper()}
-Focus: {focus}
-This is initial stage guidance - architecture and setup focus.
-"""
-        elif stage == "maintenance":
-            return f"""## Stage: {stage.upper()}
-Focus: {focus}
-This is maintenance stage guidance - stability and risk management focus.
-"""
-        else:
-            return f"""## Stage: {stage.upper()}
-Focus: {focus}
-This is development stage guidance - feature development focus.
-"""
+        return _render_stage_template(stage, focus)
+
+
+# Stage -> guidance line for load_template; unknown stages get development's
+_STAGE_GUIDANCE = {
+    'initial': "This is initial stage guidance - architecture and setup focus.",
+    'maintenance': "This is maintenance stage guidance - stability and risk management focus.",
+    'development': "This is development stage guidance - feature development focus.",
+}
+
+
+@lru_cache(maxsize=128)
+def _render_stage_template(stage: str, focus: str) -> str:
+    """Stage guidance text; a pure function of stage and focus, so memoized"""
+    guidance = _STAGE_GUIDANCE.get(stage, _STAGE_GUIDANCE['development'])
+    return f"## Stage: {stage.upper()}\nFocus: {focus}\n{guidance}\n"
 
 # Global instance
 template_loader = TemplateLoader()
\ No newline at end of file
@@ -0,0 +1,11 @@
+"""Shared botocore configuration for the Lambda handlers' AWS clients"""
+
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def aws_config():
+    """botocore Config for every handler's S3 and DynamoDB handles"""
+    # Keep-alive stops idle pooled connections from being dropped while a
+    # warm container is frozen, so later invocations can reuse them
+    from botocore.config import Config
+    return Config(tcp_keepalive=True)
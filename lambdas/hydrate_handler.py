@@ -1,21 +1,38 @@
 import json
-import boto3
 import uuid
 import os
 from datetime import datetime
-from botocore.exceptions import ClientError
-
-s3 = boto3.client('s3')
-dynamodb = boto3.resource('dynamodb')
+from functools import lru_cache
+from aws_config import aws_config
 
 bucket_name = os.environ['BUCKET_NAME']
-threads_table = dynamodb.Table(os.environ['DDB_THREADS'])
+
+# AWS handles are created on first use (boto3 is imported then too) and
+# reused by every later invocation of a warm container
+@lru_cache(maxsize=None)
+def _s3():
+    import boto3
+    return boto3.client('s3', config=aws_config())
+
+@lru_cache(maxsize=None)
+def _threads_table():
+    import boto3
+    return boto3.resource('dynamodb', config=aws_config()).Table(os.environ['DDB_THREADS'])
+
+# Shared response headers (JSON body + CORS); never mutated per request
+JSON_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key'
+}
 
 def handler(event, context):
     """
     POST /snapshots/{thread_id}/hydrate
     Save comprehensive snapshot markdown to S3 for rehydration
     """
+    from botocore.exceptions import ClientError
+    
     try:
         # Extract thread ID from path parameters
         path_params = event.get('pathParameters', {}) or {}
@@ -24,7 +41,7 @@ def handler(event, context):
         if not thread_id:
             return {
                 'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},
+                'headers': JSON_HEADERS,
                 'body': json.dumps({'error': 'thread_id parameter is required'})
             }
         
@@ -36,20 +53,22 @@ def handler(event, context):
         except json.JSONDecodeError:
             return {
                 'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},
+                'headers': JSON_HEADERS,
                 'body': json.dumps({'error': 'Invalid JSON in request body'})
             }
         
         if not markdown_content:
             return {
                 'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},
+                'headers': JSON_HEADERS,
                 'body': json.dumps({'error': 'markdown_content is required'})
             }
         
         # Generate rehydration ID
         rehydration_id = str(uuid.uuid4())
-        timestamp = datetime.utcnow().strftime('%Y%m%d-%H%M%S')
+        now = datetime.utcnow()
+        now_iso = now.isoformat()
+        timestamp = now.strftime('%Y%m%d-%H%M%S')
         
         # Create S3 key for the markdown file
         s3_key = f"rehydrations/{thread_id}/{rehydration_id}-{timestamp}.md"
@@ -58,7 +77,7 @@ def handler(event, context):
         s3_metadata = {
             'thread-id': thread_id,
             'rehydration-id': rehydration_id,
-            'created-at': datetime.utcnow().isoformat(),
+            'created-at': now_iso,
             'persona': metadata.get('persona', 'senior-backend-dev'),
             'focus': metadata.get('focus', ''),
             'output': metadata.get('output', ''),
@@ -68,23 +87,25 @@ def handler(event, context):
         }
         
         # Save markdown to S3
-        s3.put_object(
+        body_bytes = markdown_content.encode('utf-8')
+        _s3().put_object(
             Bucket=bucket_name,
             Key=s3_key,
-            Body=markdown_content,
+            Body=body_bytes,
+            ContentLength=len(body_bytes),
             ContentType='text/markdown',
             Metadata=s3_metadata
         )
         
         # Update thread record with latest rehydration info
         try:
-            threads_table.update_item(
+            _threads_table().update_item(
                 Key={'thread_id': thread_id},
                 UpdateExpression='SET latest_rehydration_id = :rid, latest_rehydration_key = :key, updated_at = :updated',
                 ExpressionAttributeValues={
                     ':rid': rehydration_id,
                     ':key': s3_key,
-                    ':updated': datetime.utcnow().isoformat()
+                    ':updated': now_iso
                 }
             )
         except ClientError as e:
@@ -93,11 +114,7 @@ def handler(event, context):
         
         return {
             'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key'
-            },
+            'headers': JSON_HEADERS,
             'body': json.dumps({
                 'rehydration_id': rehydration_id,
                 'thread_id': thread_id,
@@ -111,19 +128,14 @@ def handler(event, context):
         print(f"Error hydrating snapshot: {str(e)}")
         return {
             'statusCode': 500,
-            'headers': {'Content-Type': 'application/json'},
+            'headers': JSON_HEADERS,
             'body': json.dumps({'error': 'Internal server error'})
         }
 # hydrate_handler.py
 import json, os, uuid
 from datetime import datetime
-import boto3
-
-s3 = boto3.client('s3')
-dynamodb = boto3.resource('dynamodb')
 
 BUCKET = os.environ['BUCKET_NAME']
-THREADS = dynamodb.Table(os.environ['DDB_THREADS'])
 
 def _clean_repo(name: str) -> str:
     if not name:
@@ -153,7 +165,7 @@ def handler(event, context):
         return _bad(400, "thread_id is required")
 
     # Fetch thread for fallback values
-    t = THREADS.get_item(Key={'thread_id': thread_id}).get('Item', {}) or {}
+    t = _threads_table().get_item(Key={'thread_id': thread_id}).get('Item', {}) or {}
 
     # Extract metadata from payload (preferred) or thread
     meta = body.get('metadata') or {}
@@ -161,17 +173,20 @@ def handler(event, context):
     repo  = _clean_repo(meta.get('repo') or t.get('repo'))
 
     md = body.get('markdown_content') or ''
-    if not md.strip():
+    # Blank check without building a stripped copy of the whole document
+    if not md or md.isspace():
         return _bad(400, "markdown_content is required")
 
     rehyd_id = str(uuid.uuid4())
     now = datetime.utcnow()
     key = _s3_key(stage, repo, now, rehyd_id)
 
-    s3.put_object(
+    md_bytes = md.encode('utf-8')
+    _s3().put_object(
         Bucket=BUCKET,
         Key=key,
-        Body=md.encode('utf-8'),
+        Body=md_bytes,
+        ContentLength=len(md_bytes),
         ContentType='text/markdown',
         Metadata={
             'thread-id': thread_id,
@@ -182,7 +197,7 @@ def handler(event, context):
     )
 
     # Optionally store the last hydrated key on the thread
-    THREADS.update_item(
+    _threads_table().update_item(
         Key={'thread_id': thread_id},
         UpdateExpression='SET latest_snapshot_key = :k, updated_at = :u, stage = :s, repo = :r',
         ExpressionAttributeValues={
@@ -190,7 +205,7 @@ def handler(event, context):
         }
     )
 
-    url = s3.generate_presigned_url('get_object', Params={'Bucket': BUCKET, 'Key': key}, ExpiresIn=1800)
+    url = _s3().generate_presigned_url('get_object', Params={'Bucket': BUCKET, 'Key': key}, ExpiresIn=1800)
 
     return _ok({
         'rehydration_id': rehyd_id,
@@ -201,11 +216,5 @@ def handler(event, context):
         'repo': repo
     })
 
-def _ok(body):  return {'statusCode': 200, 'headers': _h(), 'body': json.dumps(body)}
-def _bad(c,m):  return {'statusCode': c,   'headers': _h(), 'body': json.dumps({'error': m})}
-def _h():
-    return {
-        'Content-Type': 'application/json',
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key'
-    }
+def _ok(body):  return {'statusCode': 200, 'headers': JSON_HEADERS, 'body': json.dumps(body)}
+def _bad(c,m):  return {'statusCode': c,   'headers': JSON_HEADERS, 'body': json.dumps({'error': m})}
@@ -1,12 +1,23 @@
 import json
-import boto3
 import uuid
 import os
 from datetime import datetime
-from boto3.dynamodb.conditions import Key
+from functools import lru_cache
+from aws_config import aws_config
 
-dynamodb = boto3.resource('dynamodb')
-chunks_table = dynamodb.Table(os.environ['DDB_CHUNKS_TABLE'])
+# The DynamoDB table handle is created on first use (boto3 is imported then
+# too) and reused by every later invocation of a warm container
+@lru_cache(maxsize=None)
+def _chunks_table():
+    import boto3
+    return boto3.resource('dynamodb', config=aws_config()).Table(os.environ['DDB_CHUNKS_TABLE'])
+
+# Shared response headers (JSON body + CORS); never mutated per request
+JSON_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key'
+}
 
 def handler(event, context):
     """
@@ -22,7 +33,7 @@ def handler(event, context):
     else:
         return {
             'statusCode': 405,
-            'headers': {'Content-Type': 'application/json'},
+            'headers': JSON_HEADERS,
             'body': json.dumps({'error': 'Method not allowed'})
         }
 
@@ -38,15 +49,18 @@ def create_note(event):
         if not content:
             return {
                 'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},
+                'headers': JSON_HEADERS,
                 'body': json.dumps({'error': 'Content is required'})
             }
         
-        # Guard against oversized notes
-        if len(content.encode("utf-8")) > MAX_NOTE_LEN:
+        # Guard against oversized notes. A char is 1-4 bytes of UTF-8, so the
+        # length alone settles most notes; only encode in the ambiguous band
+        if len(content) > MAX_NOTE_LEN or (
+            len(content) * 4 > MAX_NOTE_LEN and len(content.encode("utf-8")) > MAX_NOTE_LEN
+        ):
             return {
                 'statusCode': 413,
-                'headers': {'Content-Type': 'application/json'},
+                'headers': JSON_HEADERS,
                 'body': json.dumps({'error': 'Note too large (max 200KB)'})
             }
         
@@ -67,15 +81,11 @@ def create_note(event):
             'source': 'manual_entry'
         }
         
-        chunks_table.put_item(Item=note_item)
+        _chunks_table().put_item(Item=note_item)
         
         return {
             'statusCode': 201,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key'
-            },
+            'headers': JSON_HEADERS,
             'body': json.dumps({
                 'note_id': note_id,
                 'content': content,
@@ -88,20 +98,22 @@ def create_note(event):
     except json.JSONDecodeError:
         return {
             'statusCode': 400,
-            'headers': {'Content-Type': 'application/json'},
+            'headers': JSON_HEADERS,
             'body': json.dumps({'error': 'Invalid JSON in request body'})
         }
     except Exception as e:
         print(f"Error creating note: {str(e)}")
         return {
             'statusCode': 500,
-            'headers': {'Content-Type': 'application/json'},
+            'headers': JSON_HEADERS,
             'body': json.dumps({'error': 'Internal server error'})
         }
     
 # Add this function after create_note()
 def get_notes(event):
     """Retrieve notes with optional filtering"""
+    from boto3.dynamodb.conditions import Attr, Key
+    
     try:
         # Parse query parameters
         query_params = event.get('queryStringParameters') or {}
@@ -115,17 +127,18 @@ def get_notes(event):
         try:
             if thread_id:
                 # Query notes for specific thread
-                response = chunks_table.query(
+                response = _chunks_table().query(
                     IndexName='ThreadIndex',  # Assumes you have a GSI on thread_id
                     KeyConditionExpression=Key('thread_id').eq(thread_id) & Key('ns').eq('notes'),
                     Limit=limit,
                     ScanIndexForward=False  # Most recent first
                 )
             else:
-                # Get all notes (scan operation)
-                response = chunks_table.scan(
-                    FilterExpression=Key('ns').eq('notes'),
-                    Limit=limit
+                # Newest notes straight from the 'notes' partition (sort key is timestamp#id)
+                response = _chunks_table().query(
+                    KeyConditionExpression=Key('ns').eq('notes'),
+                    Limit=limit,
+                    ScanIndexForward=False  # Most recent first
                 )
             
             notes = []
@@ -141,11 +154,7 @@ def get_notes(event):
             
             return {
                 'statusCode': 200,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*',
-                    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key'
-                },
+                'headers': JSON_HEADERS,
                 'body': json.dumps({
                     'notes': notes,
                     'count': len(notes),
@@ -154,32 +163,43 @@ def get_notes(event):
             }
             
         except Exception as db_error:
-            # If GSI doesn't exist, fall back to scan
-            print(f"Database query error (falling back to scan): {str(db_error)}")
-            response = chunks_table.scan(
-                FilterExpression=Key('ns').eq('notes'),
-                Limit=limit
-            )
+            # Only the thread lookup has a fallback (for a missing GSI); the
+            # unfiltered query already reads the partition, so just fail
+            if not thread_id:
+                raise
+            # Page through the 'notes' partition instead of scanning the
+            # table; Limit applies before the filter, so keep following
+            # LastEvaluatedKey until enough notes match
+            print(f"Database query error (falling back to partition query): {str(db_error)}")
+            query_args = {
+                'KeyConditionExpression': Key('ns').eq('notes'),
+                'FilterExpression': Attr('thread_id').eq(thread_id),
+                'Limit': limit,
+                'ScanIndexForward': False  # Most recent first
+            }
+            
+            items = []
+            while len(items) < limit:
+                response = _chunks_table().query(**query_args)
+                items.extend(response.get('Items', []))
+                if 'LastEvaluatedKey' not in response:
+                    break
+                query_args['ExclusiveStartKey'] = response['LastEvaluatedKey']
             
             notes = []
-            for item in response.get('Items', []):
-                if not thread_id or item.get('thread_id') == thread_id:
-                    notes.append({
-                        'note_id': item.get('id'),
-                        'content': item.get('content'),
-                        'tags': item.get('tags', []),
-                        'thread_id': item.get('thread_id'),
-                        'created_at': item.get('created_at'),
-                        'type': item.get('type')
-                    })
+            for item in items[:limit]:
+                notes.append({
+                    'note_id': item.get('id'),
+                    'content': item.get('content'),
+                    'tags': item.get('tags', []),
+                    'thread_id': item.get('thread_id'),
+                    'created_at': item.get('created_at'),
+                    'type': item.get('type')
+                })
             
             return {
                 'statusCode': 200,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*',
-                    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key'
-                },
+                'headers': JSON_HEADERS,
                 'body': json.dumps({
                     'notes': notes,
                     'count': len(notes)
@@ -190,6 +210,6 @@ def get_notes(event):
         print(f"Error retrieving notes: {str(e)}")
         return {
             'statusCode': 500,
-            'headers': {'Content-Type': 'application/json'},
+            'headers': JSON_HEADERS,
             'body': json.dumps({'error': 'Internal server error'})
-        }
\ No newline at end of file
+        }
@@ -1,10 +1,11 @@
 import json
 import boto3
 import os
+from aws_config import aws_config
 from botocore.exceptions import ClientError
 
-s3 = boto3.client('s3')
-dynamodb = boto3.resource('dynamodb')
+s3 = boto3.client('s3', config=aws_config())
+dynamodb = boto3.resource('dynamodb', config=aws_config())
 
 bucket_name = os.environ['BUCKET_NAME']
 threads_table = dynamodb.Table(os.environ['DDB_THREADS'])
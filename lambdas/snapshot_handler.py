@@ -1,9 +1,10 @@
 import json, os, uuid
 from datetime import datetime
 import boto3
+from aws_config import aws_config
 
-s3 = boto3.client('s3')
-dynamodb = boto3.resource('dynamodb')
+s3 = boto3.client('s3', config=aws_config())
+dynamodb = boto3.resource('dynamodb', config=aws_config())
 
 BUCKET = os.environ['BUCKET_NAME']
 THREADS = dynamodb.Table(os.environ['DDB_THREADS'])
@@ -125,7 +126,7 @@ def _handle_comprehensive(event):
         'stage': stage,
         'repo': repo,
         'sources_count': len(sources),
-        'synth_keys': list(synth.keys())
+        'synth_keys': list(synth)
     })
 
 def _minimal_markdown(thread, snapshot_id, created_at, message):
@@ -3,8 +3,9 @@ import boto3
 import uuid
 from datetime import datetime
 import os
+from aws_config import aws_config
 
-dynamodb = boto3.resource('dynamodb')
+dynamodb = boto3.resource('dynamodb', config=aws_config())
 threads_table = dynamodb.Table(os.environ['DDB_THREADS'])
 
 def handler(event, context):
@@ -29,12 +30,13 @@ def handler(event, context):
         
         # Generate thread ID and name
         thread_id = str(uuid.uuid4())
-        timestamp = datetime.utcnow().isoformat() + 'Z'
+        now = datetime.utcnow()
+        timestamp = now.isoformat() + 'Z'
         
         # Create descriptive thread name from goal (first 50 chars, safe for filenames)
         thread_name = ''.join(c for c in goal[:50] if c.isalnum() or c in (' ', '-', '_')).strip()
         if not thread_name:
-            thread_name = f"thread-{datetime.utcnow().strftime('%Y%m%d-%H%M')}"
+            thread_name = f"thread-{now.strftime('%Y%m%d-%H%M')}"
         
         # Create thread record
         thread_item = {
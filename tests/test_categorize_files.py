@@ -0,0 +1,25 @@
+import unittest
+
+from copidock.cli.synthesis.base import categorize_files
+
+
+class CategorizeFilesTest(unittest.TestCase):
+    def test_dot_named_files_keep_their_extension_category(self):
+        categories = categorize_files(['.tf', 'components/.tf', 'docs/.md', '.PY'])
+        self.assertEqual(categories, {
+            'Infrastructure': ['.tf', 'components/.tf'],
+            'Backend/Lambda': ['.PY'],
+            'Documentation': ['docs/.md'],
+        })
+
+    def test_only_the_last_suffix_of_the_basename_counts(self):
+        categories = categorize_files(['app.min.js', 'package.json', 'notes.py.bak', 'src.py/Makefile'])
+        self.assertEqual(categories, {
+            'Frontend': ['app.min.js'],
+            'Configuration': ['package.json'],
+            'Other': ['notes.py.bak', 'src.py/Makefile'],
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()